@@ -5,7 +5,8 @@ from pathlib import Path
 
 import yaml
 
-from src.stt.server import BaseSTT, DummySTT
+from src.pipeline import PipelineService
+from src.stt.registry import create_stt_engine
 
 # Configure logging
 logging.basicConfig(
@@ -29,24 +30,6 @@ def load_config():
         return {}
 
 
-def create_stt_engine(config: dict) -> BaseSTT:
-    """
-    Create and return an STT engine based on configuration.
-    Falls back to DummySTT if no engine is configured or if configured engine fails.
-    """
-    engine_name = config.get("stt", {}).get("engine")
-
-    if not engine_name or engine_name == "placeholder":
-        logger.warning("No STT engine configured, falling back to DummySTT")
-        return DummySTT()
-
-    # Here we'll add support for other engines (Google, Vosk, Whisper)
-    # For now, just return DummySTT
-    logger.warning(
-        f"STT engine '{engine_name}' not implemented yet, using DummySTT")
-    return DummySTT()
-
-
 def main():
     """Main entry point for VoxBridge"""
     logger.info("VoxBridge is starting")
@@ -66,6 +49,13 @@ def main():
         stt_engine = create_stt_engine(config)
         logger.info(f"Initialized STT engine: {stt_engine.__class__.__name__}")
         stt_engine.start()  # This will run the service loop
+    elif service_name == "all":
+        # All-in-one mode: every stage in this process, for small sites
+        pipeline = PipelineService(config)
+        logger.info(
+            f"Initialized in-process pipeline with STT engine: "
+            f"{pipeline.stt.__class__.__name__}")
+        pipeline.start()
     else:
         logger.info(f"Service {service_name} not handled by this instance")
 
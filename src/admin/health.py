@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
+
+from src.common.client import ServiceClient
+
+logger = logging.getLogger(__name__)
+
+
+class HealthAggregator:
+    """
+    Polls the health endpoints of all configured services in the background.
+
+    Every service is checked concurrently with its own timeout, so a hung
+    service only marks itself as down instead of stalling the status page.
+    The latest results are cached for instant reads, status changes are
+    pushed to subscribers, and a short history is kept per service.
+    """
+
+    def __init__(self, services: Dict[str, Dict[str, Any]],
+                 interval: float = 5.0, timeout: float = 2.0,
+                 history_size: int = 120,
+                 exclude: Iterable[str] = ("admin",)):
+        """
+        Initialize the health aggregator.
+
+        Args:
+            services: The `services:` block of the config, keyed by service name
+            interval: Seconds between polling rounds (default: 5)
+            timeout: Default per-service timeout in seconds; a service entry
+                may override it with its own `timeout` key (default: 2)
+            history_size: Number of results kept per service (default: 120)
+            exclude: Services not to poll (default: the admin service itself)
+        """
+        self.interval = interval
+        self.timeouts: Dict[str, float] = {}
+        self.clients: Dict[str, ServiceClient] = {}
+        for name, service_config in services.items():
+            if name in exclude:
+                continue
+            service_timeout = service_config.get("timeout", timeout)
+            self.timeouts[name] = service_timeout
+            self.clients[name] = ServiceClient(
+                name, {**service_config, "timeout": service_timeout})
+
+        self.snapshot: Dict[str, Dict[str, Any]] = {
+            name: {"status": "unknown", "latency_ms": None,
+                   "checked_at": None, "details": None, "error": None}
+            for name in self.clients
+        }
+        self.history: Dict[str, Deque[Dict[str, Any]]] = {
+            name: deque(maxlen=history_size) for name in self.clients
+        }
+        self.updated_at: Optional[float] = None
+        self.subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start polling in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll_loop())
+            logger.info(
+                f"Health aggregator polling {sorted(self.clients)} "
+                f"every {self.interval}s")
+
+    async def stop(self) -> None:
+        """Stop polling and close the HTTP clients."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for client in self.clients.values():
+            await client.close()
+
+    async def _check(self, name: str, client: ServiceClient) -> Dict[str, Any]:
+        started = time.monotonic()
+        result: Dict[str, Any] = {"details": None, "error": None}
+        try:
+            response = await asyncio.wait_for(
+                client.health_check(retry=False), self.timeouts[name])
+            result["status"] = response.get("status", "unknown")
+            result["details"] = response.get("details")
+        except asyncio.TimeoutError:
+            result["status"] = "timeout"
+            result["error"] = f"No response within {self.timeouts[name]}s"
+        except Exception as e:
+            result["status"] = "unreachable"
+            result["error"] = str(e)
+        result["latency_ms"] = round((time.monotonic() - started) * 1000, 1)
+        result["checked_at"] = time.time()
+        return result
+
+    async def poll_once(self) -> None:
+        """Check every service once and publish the snapshot if anything changed."""
+        names = list(self.clients)
+        results = await asyncio.gather(
+            *(self._check(name, self.clients[name]) for name in names))
+
+        changed = False
+        for name, result in zip(names, results):
+            previous = self.snapshot[name]["status"]
+            if result["status"] != previous:
+                changed = True
+                logger.info(
+                    f"Service {name} changed from {previous} to {result['status']}")
+            self.snapshot[name] = result
+            self.history[name].append({
+                "t": result["checked_at"],
+                "status": result["status"],
+                "latency_ms": result["latency_ms"]
+            })
+        self.updated_at = time.time()
+
+        if changed:
+            self._publish(self.get_snapshot())
+
+    async def _poll_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error(f"Health polling failed: {e}", exc_info=True)
+            await asyncio.sleep(max(0.0, self.interval - (loop.time() - started)))
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Return the cached health of all services without polling."""
+        statuses = [s["status"] for s in self.snapshot.values()]
+        if all(status == "healthy" for status in statuses):
+            overall = "healthy"
+        elif any(status == "healthy" for status in statuses):
+            overall = "degraded"
+        else:
+            overall = "unhealthy"
+        return {
+            "status": overall,
+            "updated_at": self.updated_at,
+            "services": {name: dict(s) for name, s in self.snapshot.items()}
+        }
+
+    def get_history(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the recent results per service, oldest first."""
+        return {name: list(entries) for name, entries in self.history.items()}
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register for snapshots pushed whenever a service changes status."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Stop receiving pushed snapshots."""
+        self.subscribers.discard(queue)
+
+    def _publish(self, snapshot: Dict[str, Any]) -> None:
+        for queue in self.subscribers:
+            if queue.full():
+                # A slow client only needs the latest state
+                queue.get_nowait()
+            queue.put_nowait(snapshot)
@@ -1,11 +1,109 @@
+import asyncio
+import json
 import logging
-import time
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict
+
+import uvicorn
+import yaml
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from src.admin.health import HealthAggregator
 
 logger = logging.getLogger(__name__)
 
+# Seconds between SSE keep-alive comments when nothing has changed
+SSE_KEEPALIVE = 15.0
+
+
+def load_config() -> Dict[str, Any]:
+    """Load configuration from the appropriate YAML file"""
+    env = os.getenv("VOXBRIDGE_ENV", "development")
+    config_path = Path(f"config/{env}.yaml")
+
+    try:
+        with open(config_path, "r") as f:
+            return yaml.safe_load(f)
+    except Exception as e:
+        logger.error(f"Failed to load configuration from {config_path}: {e}")
+        return {}
+
+
+def create_app(config: Dict[str, Any]) -> FastAPI:
+    """
+    Create the admin API application.
+
+    Args:
+        config: The loaded VoxBridge configuration
+
+    Returns:
+        FastAPI: The admin application
+    """
+    health_config = config.get("admin", {}).get("health", {})
+    aggregator = HealthAggregator(
+        config.get("services", {}),
+        interval=health_config.get("interval", 5.0),
+        timeout=health_config.get("timeout", 2.0),
+        history_size=health_config.get("history_size", 120)
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        await aggregator.start()
+        yield
+        await aggregator.stop()
+
+    app = FastAPI(lifespan=lifespan)
+    app.state.health = aggregator
+
+    @app.get("/health")
+    async def health_check() -> Dict[str, Any]:
+        return JSONResponse(content={"status": "healthy", "service": "admin"})
+
+    @app.get("/api/status")
+    async def status() -> Dict[str, Any]:
+        return JSONResponse(content=aggregator.get_snapshot())
+
+    @app.get("/api/status/history")
+    async def status_history() -> Dict[str, Any]:
+        return JSONResponse(content=aggregator.get_history())
+
+    @app.get("/api/status/stream")
+    async def status_stream(request: Request) -> StreamingResponse:
+        async def events() -> AsyncIterator[str]:
+            queue = aggregator.subscribe()
+            try:
+                # Send the current state first so the page renders immediately
+                yield f"data: {json.dumps(aggregator.get_snapshot())}\n\n"
+                while not await request.is_disconnected():
+                    try:
+                        snapshot = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE)
+                        yield f"data: {json.dumps(snapshot)}\n\n"
+                    except asyncio.TimeoutError:
+                        yield ": keep-alive\n\n"
+            finally:
+                aggregator.unsubscribe(queue)
+
+        return StreamingResponse(
+            events(), media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"})
+
+    return app
+
+
+def start_server():
+    config = load_config()
+    port = config.get("services", {}).get("admin", {}).get("port", 3000)
+    logger.info(f"Starting admin service on port {port}")
+    uvicorn.run(create_app(config), host="0.0.0.0", port=port)
+
+
 if __name__ == "__main__":
-    logger.info("Starting Admin service")
-    # This is just a placeholder that keeps the container running
-    while True:
-        logger.info("Admin service running...")
-        time.sleep(60)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    start_server()
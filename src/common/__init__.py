@@ -1,9 +1,16 @@
-from .download_audio import AudioDownloader, download_audio
+from .capture import CaptureWriter, ReplayReader
+from .download_audio import (AudioCache, AudioDownloader, download_audio,
+                             download_many)
+from .resampler import PolyphaseResampler, RateFanout
+from .rtmp_load import LoadStream, RTMPLoadGenerator
 from .rtmp_reader import RTMPReader, create_reader
 from .rtmp_sender import RTMPSender, stream_file
 
 __all__ = [
     "RTMPReader", "create_reader",
+    "CaptureWriter", "ReplayReader",
     "RTMPSender", "stream_file",
-    "AudioDownloader", "download_audio"
+    "RTMPLoadGenerator", "LoadStream",
+    "PolyphaseResampler", "RateFanout",
+    "AudioCache", "AudioDownloader", "download_audio", "download_many"
 ]
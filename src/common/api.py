@@ -1,15 +1,54 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
 import asyncio
-from typing import Any, Dict
+import hmac
+from typing import Any, Dict, Iterator, Optional
+
+from src.common.profiling import Profiler, ProfilerBusyError
+
+
+class ServiceCollector:
+    """
+    Exports a service's metrics() to Prometheus. Values are read when
+    scraped, so the service loop does no extra work between scrapes.
+    """
+
+    def __init__(self, service: Any):
+        self.service = service
+
+    def collect(self) -> Iterator[Any]:
+        name = getattr(self.service, "service_name", "unknown")
+        for metric, value in self.service.metrics().items():
+            family = CounterMetricFamily if metric.endswith("_total") else GaugeMetricFamily
+            sample = family(f"voxbridge_{metric}", metric.replace("_", " "),
+                            labels=["service"])
+            sample.add_metric([name], value)
+            yield sample
+
 
 class ServiceAPI:
     def __init__(self, service: Any):
         self.app = FastAPI()
         self.service = service
+        profiling_config = getattr(service, "config", {}).get("profiling", {})
+        # Off unless configured; with a token, /debug requests must send it
+        # as "Authorization: Bearer <token>"
+        self.profiling_enabled = profiling_config.get("enabled", False)
+        self.profiling_token = profiling_config.get("token") or None
+        self.profiler = Profiler(
+            max_duration=profiling_config.get("max_duration", 60.0),
+            min_interval=profiling_config.get("min_interval", 0.001),
+            max_memory_duration=profiling_config.get("max_memory_duration", 10.0)
+        )
+        self.registry = CollectorRegistry()
+        if hasattr(service, "metrics"):
+            self.registry.register(ServiceCollector(service))
         self.setup_middleware()
         self.setup_routes()
+        self.setup_profiling_routes()
 
     def setup_middleware(self) -> None:
         self.app.add_middleware(
@@ -30,6 +69,72 @@ class ServiceAPI:
                 raise HTTPException(status_code=503, detail=str(e))
 
         @self.app.get("/metrics")
-        async def metrics() -> Dict[str, Any]:
-            # Implement Prometheus metrics
-            pass
\ No newline at end of file
+        async def metrics() -> Response:
+            return Response(generate_latest(self.registry), media_type=CONTENT_TYPE_LATEST)
+
+    def setup_profiling_routes(self) -> None:
+        """
+        Diagnostics for a running service, enabled with profiling.enabled
+        and protected by profiling.token when set. Profiles run in a worker
+        thread for a bounded time, one at a time; a second request gets a 409.
+        """
+        def check_enabled(authorization: Optional[str]) -> None:
+            if not self.profiling_enabled:
+                raise HTTPException(status_code=404, detail="Profiling is disabled")
+            if self.profiling_token and not hmac.compare_digest(
+                    authorization or "", f"Bearer {self.profiling_token}"):
+                raise HTTPException(status_code=401, detail="Invalid or missing token")
+
+        @self.app.get("/debug/profile")
+        async def profile(duration: float = 10.0, interval: float = 0.005,
+                          all_threads: bool = False, format: str = "collapsed",
+                          authorization: Optional[str] = Header(None)):
+            """
+            Sample the service loop's call stacks. The default "collapsed"
+            format ("frame;frame;frame count" per line) can be fed directly
+            to flamegraph.pl or speedscope; "json" returns the same counts
+            with sampling metadata.
+            """
+            check_enabled(authorization)
+            if format not in ("collapsed", "json"):
+                raise HTTPException(status_code=400, detail="format must be 'collapsed' or 'json'")
+            thread_id = None if all_threads else getattr(self.service, "loop_thread_id", None)
+            try:
+                result = await asyncio.to_thread(
+                    self.profiler.sample_stacks, duration, interval, thread_id)
+            except ProfilerBusyError as e:
+                raise HTTPException(status_code=409, detail=str(e))
+
+            if format == "json":
+                return JSONResponse(content=result)
+            lines = [f"{stack} {count}" for stack, count in result["stacks"].items()]
+            return PlainTextResponse("\n".join(lines) + "\n")
+
+        @self.app.get("/debug/memory")
+        async def memory(duration: float = 10.0, top: int = 25, frames: int = 10,
+                         group_by: str = "lineno",
+                         authorization: Optional[str] = Header(None)):
+            """Diff of heap allocations between the start and end of the window."""
+            check_enabled(authorization)
+            if group_by not in ("lineno", "filename", "traceback"):
+                raise HTTPException(
+                    status_code=400, detail="group_by must be 'lineno', 'filename' or 'traceback'")
+            try:
+                result = await asyncio.to_thread(
+                    self.profiler.memory_diff, duration, top, frames, group_by)
+            except ProfilerBusyError as e:
+                raise HTTPException(status_code=409, detail=str(e))
+            return JSONResponse(content=result)
+
+        @self.app.get("/debug/stages")
+        async def stages(reset: bool = False,
+                         authorization: Optional[str] = Header(None)):
+            """Per-stage timing breakdown of the service loop."""
+            check_enabled(authorization)
+            stage_timer = getattr(self.service, "stage_timer", None)
+            if stage_timer is None:
+                raise HTTPException(status_code=404, detail="Service does not record stage timings")
+            result = stage_timer.snapshot()
+            if reset:
+                stage_timer.reset()
+            return JSONResponse(content=result)
@@ -2,21 +2,55 @@ import logging
 import logging.handlers
 import os
 import signal
+import threading
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import yaml
 
+from src.common.config_watcher import ConfigWatcher, validate_config
+from src.common.logging_utils import DroppingQueueHandler, setup_queued_logging
+from src.common.profiling import StageTimer
+
 
 class BaseService(ABC):
-    def __init__(self, service_name: str):
+    # Pause between service loop iterations; services whose loop blocks on
+    # I/O can set this to 0
+    loop_interval = 0.1
+
+    def __init__(self, service_name: str,
+                 config: Optional[Dict[Any, Any]] = None,
+                 standalone: bool = True):
+        """
+        Args:
+            service_name: Name used for the logger, log file and health reports
+            config: Configuration to use instead of loading it from disk
+            standalone: Whether this instance runs the service. Components
+                built by a running service (e.g. a replacement engine during
+                a hot swap) pass False to reuse its logging and leave signal
+                handlers alone, which can only be set on the main thread.
+        """
         self.service_name = service_name
         self.running = False
-        self.config = self.load_config()  # Load config first
-        self.setup_logging()  # Then set up logging
+        self.standalone = standalone
+        self.log_handler: Optional[DroppingQueueHandler] = None
+        self.log_listener: Optional[logging.handlers.QueueListener] = None
+        self.config_watcher: Optional[ConfigWatcher] = None
+        self.api_server: Optional[Any] = None
+        self.config_path = Path(
+            f"config/{os.getenv('VOXBRIDGE_ENV', 'development')}.yaml")
         self.logger = logging.getLogger(f"voxbridge.{service_name}")
+        # Per-stage timings of the service loop, and the thread running it,
+        # for the profiling routes of ServiceAPI
+        self.stage_timer = StageTimer()
+        self.loop_thread_id: Optional[int] = None
+        # Load config first
+        self.config = config if config is not None else self.load_config()
+        if not standalone:
+            return
+        self.setup_logging()  # Then set up logging
         # Add startup message
         self.logger.info(f"Initializing {service_name} service")
         self.setup_signal_handlers()
@@ -37,8 +71,11 @@ class BaseService(ABC):
         )
         handler.setFormatter(formatter)
 
+        # File and console output happen on the listener thread, so disk
+        # stalls and rotation never block the service loop
         logger = logging.getLogger(f"voxbridge.{self.service_name}")
-        logger.addHandler(handler)
+        self.log_handler, self.log_listener = setup_queued_logging(
+            logger, [handler], self.config.get('log_queue_size', 10000))
         valid_levels = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
         log_level = self.config.get('log_level', 'INFO').upper()
         if log_level not in valid_levels:
@@ -47,16 +84,79 @@ class BaseService(ABC):
                 f"Invalid log level '{log_level}' specified in config. Defaulting to INFO.")
         logger.setLevel(getattr(logging, log_level))
 
+    def stop_logging(self) -> None:
+        """Flush queued log records and stop the listener thread."""
+        if self.log_listener:
+            self.log_listener.stop()
+            self.log_listener = None
+
+    def logging_stats(self) -> Dict[str, int]:
+        """Return counters for the queued logging pipeline."""
+        if not self.log_handler:
+            return {"log_records_dropped": 0, "log_queue_depth": 0}
+        return {
+            "log_records_dropped": self.log_handler.dropped,
+            "log_queue_depth": self.log_handler.queue.qsize()
+        }
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Values exported on the API's /metrics route, read at scrape time.
+        Names ending in _total are counters, the rest gauges; services
+        extend this with their own.
+        """
+        stats = self.logging_stats()
+        return {
+            "log_records_dropped_total": stats["log_records_dropped"],
+            "log_queue_depth": stats["log_queue_depth"]
+        }
+
     def load_config(self) -> Dict[Any, Any]:
-        env = os.getenv("VOXBRIDGE_ENV", "development")
-        config_path = f"config/{env}.yaml"
         try:
-            with open(config_path) as f:
+            with open(self.config_path) as f:
                 return yaml.safe_load(f)
         except Exception as e:
             self.logger.error(f"Failed to load config: {e}")
             return {}
 
+    def validate_config(self, config: Any) -> None:
+        """
+        Check a reloaded configuration before it is applied.
+        Services extend this with their own checks.
+
+        Raises:
+            ValueError: If the configuration is not usable
+        """
+        validate_config(config)
+
+    def start_config_watcher(self) -> None:
+        """Start hot-reloading the config file if config_reload is enabled."""
+        reload_config = self.config.get("config_reload", {})
+        if not reload_config.get("enabled", False) or self.config_watcher:
+            return
+        self.config_watcher = ConfigWatcher(
+            self.config_path,
+            self._on_config_change,
+            self.config,
+            validate=self.validate_config,
+            interval=reload_config.get("interval", 2.0)
+        )
+        self.config_watcher.start()
+
+    def _on_config_change(self, old: Dict[Any, Any], new: Dict[Any, Any]) -> None:
+        self.config = new
+        log_level = str(new.get('log_level', 'INFO')).upper()
+        if log_level in {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}:
+            self.logger.setLevel(getattr(logging, log_level))
+        self.on_config_change(old, new)
+
+    def on_config_change(self, old: Dict[Any, Any], new: Dict[Any, Any]) -> None:
+        """
+        Apply a validated configuration change while the service runs.
+        Called on the config watcher thread; self.config is already updated.
+        """
+        pass
+
     def setup_signal_handlers(self) -> None:
         signal.signal(signal.SIGTERM, self.handle_shutdown)
         signal.signal(signal.SIGINT, self.handle_shutdown)
@@ -76,19 +176,68 @@ class BaseService(ABC):
         """Implement service-specific health check"""
         pass
 
+    def api_port(self) -> Optional[int]:
+        """Port to serve the service API on, from services.<name>.port."""
+        return self.config.get("services", {}).get(self.service_name, {}).get("port")
+
+    def start_api(self) -> None:
+        """
+        Serve ServiceAPI (health and /debug routes) on a background thread
+        if api.enabled is set.
+        """
+        api_config = self.config.get("api", {})
+        if not api_config.get("enabled", False) or self.api_server:
+            return
+        port = self.api_port()
+        if not port:
+            self.logger.warning(
+                f"No port configured for {self.service_name}, not serving its API")
+            return
+
+        # Imported here so services without an API don't need the web stack
+        import uvicorn
+
+        from src.common.api import ServiceAPI
+
+        self.api_server = uvicorn.Server(uvicorn.Config(
+            ServiceAPI(self).app,
+            host=api_config.get("host", "0.0.0.0"),
+            port=port,
+            log_level="warning"
+        ))
+        # Off the main thread uvicorn leaves the signal handlers alone
+        threading.Thread(target=self.api_server.run,
+                         name=f"{self.service_name}-api", daemon=True).start()
+        self.logger.info(f"Serving {self.service_name} API on port {port}")
+
+    def stop_api(self) -> None:
+        """Ask the API server to shut down."""
+        if self.api_server:
+            self.api_server.should_exit = True
+            self.api_server = None
+
     def start(self) -> None:
         self.running = True
+        self.loop_thread_id = threading.get_ident()
         self.logger.info(f"Starting {self.service_name} service")
+        self.start_config_watcher()
+        self.start_api()
         try:
             while self.running:
                 self._run_service_loop()
-                time.sleep(0.1)  # Prevent CPU spinning
+                if self.loop_interval:
+                    time.sleep(self.loop_interval)  # Prevent CPU spinning
         except Exception as e:
             # Add exc_info=True for traceback
             self.logger.error(f"Service error: {e}", exc_info=True)
             self.running = False
         finally:
+            if self.config_watcher:
+                self.config_watcher.stop()
+                self.config_watcher = None
+            self.stop_api()
             self.cleanup()
+            self.stop_logging()
 
     @abstractmethod
     def _run_service_loop(self) -> None:
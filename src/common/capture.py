@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+
+import json
+import logging
+import mmap
+import time
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger("voxbridge.capture")
+
+# One record per captured chunk: where its samples start in the PCM file,
+# how many there are, when the consumer read it (seconds since the first
+# chunk) and the reader's lag at that moment. The chunk arrived at
+# time - lag; the difference is how far behind the consumer was.
+INDEX_DTYPE = np.dtype([
+    ('offset', '<i8'),
+    ('samples', '<i4'),
+    ('time', '<f8'),
+    ('lag', '<f4'),
+])
+
+
+def capture_paths(path: Union[str, Path]) -> Dict[str, Path]:
+    """
+    Files that make up a capture.
+
+    Args:
+        path: Capture path without extension
+
+    Returns:
+        dict: Paths of the raw PCM data, chunk index and JSON metadata
+    """
+    path = Path(path)
+    return {
+        'pcm': path.with_name(path.name + '.pcm'),
+        'index': path.with_name(path.name + '.idx'),
+        'meta': path.with_name(path.name + '.json'),
+    }
+
+
+class CaptureWriter:
+    """
+    Records the PCM chunks a reader yields, with their timing, for replay.
+
+    Samples are appended to a memory-mapped file that grows in large steps,
+    so a write is a memcpy into the page cache rather than a system call
+    per chunk. A fixed-size record per chunk is appended to the index file,
+    and the stream's format is kept in a JSON sidecar.
+    """
+
+    def __init__(self, path: Union[str, Path], sample_rate: int,
+                 sample_format: str, dtype: Any,
+                 filters: Optional[List[str]] = None,
+                 max_bytes: Optional[int] = None,
+                 grow_seconds: float = 60.0):
+        """
+        Create a capture, replacing any existing one at the same path.
+
+        Args:
+            path: Capture path without extension
+            sample_rate: Sample rate of the captured audio in Hz
+            sample_format: PCM format name, e.g. 'f32le'
+            dtype: numpy dtype of the samples
+            filters: ffmpeg filters the audio went through, for reference
+            max_bytes: Stop capturing once the PCM data reaches this size
+            grow_seconds: Seconds of audio to extend the file by when full
+        """
+        self.paths = capture_paths(path)
+        self.paths['pcm'].parent.mkdir(parents=True, exist_ok=True)
+        self.sample_rate = sample_rate
+        self.dtype = np.dtype(dtype)
+        self.max_bytes = max_bytes
+        self.grow_bytes = int(grow_seconds * sample_rate) * self.dtype.itemsize
+        self.meta = {
+            'sample_rate': sample_rate,
+            'sample_format': sample_format,
+            'dtype': self.dtype.str,
+            'filters': list(filters or []),
+            'created': time.time(),
+        }
+
+        self._pcm = open(self.paths['pcm'], 'w+b')
+        self._index = open(self.paths['index'], 'wb')
+        self._mmap: Optional[mmap.mmap] = None
+        self._capacity = 0
+        self.bytes_written = 0
+        self.chunks = 0
+        self.origin: Optional[float] = None
+        self.full = False
+        self._write_meta()
+        logger.info(f"Capturing audio to {self.paths['pcm']}")
+
+    def _write_meta(self) -> None:
+        with open(self.paths['meta'], 'w') as f:
+            json.dump(self.meta, f, indent=2)
+
+    def _grow(self, needed: int) -> None:
+        capacity = max(needed, self._capacity + self.grow_bytes)
+        if self._mmap:
+            self._mmap.close()
+        self._pcm.truncate(capacity)
+        self._mmap = mmap.mmap(self._pcm.fileno(), capacity)
+        self._capacity = capacity
+
+    def write(self, chunk: np.ndarray, lag: float = 0.0) -> None:
+        """
+        Append a chunk.
+
+        Args:
+            chunk: PCM samples as yielded by the reader
+            lag: The reader's lag when the chunk was read, in seconds
+        """
+        if self.full or self._pcm.closed:
+            return
+
+        now = time.monotonic()
+        if self.origin is None:
+            self.origin = now
+
+        data = np.ascontiguousarray(chunk, dtype=self.dtype).view(np.uint8)
+        end = self.bytes_written + data.nbytes
+        if self.max_bytes and end > self.max_bytes:
+            self.full = True
+            logger.warning(
+                f"Capture {self.paths['pcm']} reached its size limit, "
+                "no more audio will be recorded")
+            return
+        if end > self._capacity:
+            self._grow(end)
+
+        self._mmap[self.bytes_written:end] = data.data
+        record = np.array(
+            [(self.bytes_written // self.dtype.itemsize, len(chunk),
+              now - self.origin, lag)],
+            dtype=INDEX_DTYPE)
+        self._index.write(record.tobytes())
+        self.bytes_written = end
+        self.chunks += 1
+
+    @property
+    def duration(self) -> float:
+        """Seconds of audio captured so far."""
+        return self.bytes_written / self.dtype.itemsize / self.sample_rate
+
+    def close(self) -> None:
+        """Flush the capture and trim the PCM file to the data written."""
+        if self._pcm.closed:
+            return
+        if self._mmap:
+            self._mmap.flush()
+            self._mmap.close()
+            self._mmap = None
+        self._pcm.truncate(self.bytes_written)
+        self._pcm.close()
+        self._index.close()
+        self.meta.update(chunks=self.chunks, duration=self.duration)
+        self._write_meta()
+        logger.info(
+            f"Captured {self.chunks} chunks ({self.duration:.1f}s) "
+            f"to {self.paths['pcm']}")
+
+
+class ReplayReader:
+    """
+    Plays a capture back with the same interface as RTMPReader.
+
+    Yields the recorded chunks with their original boundaries, either at the
+    times they originally arrived (speed=1.0), scaled (e.g. speed=2.0 for
+    twice as fast) or as fast as the consumer takes them (speed=0). Arrival
+    is the read time minus the recorded lag, so a faster engine is not held
+    back by the lag of the consumer that made the capture. The samples are
+    read straight from the memory-mapped capture. Chunk boundaries are
+    always the recorded ones; set_chunk_size() is ignored.
+    """
+
+    def __init__(self, path: Union[str, Path], speed: float = 1.0,
+                 loop: bool = False):
+        """
+        Open a capture for replay.
+
+        Args:
+            path: Capture path without extension
+            speed: Playback speed relative to the original arrival times;
+                0 replays as fast as possible (default: 1.0)
+            loop: Start again from the beginning after the last chunk
+        """
+        paths = capture_paths(path)
+        with open(paths['meta']) as f:
+            self.meta = json.load(f)
+
+        self.path = Path(path)
+        self.rtmp_url = f"replay:{self.path}"
+        self.sample_rate = self.meta['sample_rate']
+        self.sample_format = self.meta['sample_format']
+        self.filters = self.meta.get('filters', [])
+        self.dtype = np.dtype(self.meta['dtype'])
+        self.speed = speed
+        self.loop = loop
+
+        # A capture that was not closed cleanly may end in a partial record
+        # and preallocated space; only replay what the index covers
+        self.index = np.fromfile(paths['index'], dtype=INDEX_DTYPE)
+        self.samples: np.ndarray = np.empty(0, dtype=self.dtype)
+        if paths['pcm'].stat().st_size:
+            self.samples = np.memmap(paths['pcm'], dtype=self.dtype, mode='r')
+        if len(self.index):
+            available = (self.index['offset'] + self.index['samples']) <= len(self.samples)
+            self.index = self.index[available]
+        self.chunk_size = float(np.median(self.index['samples'])) / self.sample_rate \
+            if len(self.index) else 0.0
+
+        self.stream_origin: Optional[float] = None
+        self.samples_read = 0
+        self.running = False
+
+    @property
+    def duration(self) -> float:
+        """Seconds of audio in the capture."""
+        return int(self.index['samples'].sum()) / self.sample_rate
+
+    def start(self) -> None:
+        """Start (or restart) playback from the first chunk."""
+        self.stream_origin = None
+        self.samples_read = 0
+        self.running = True
+        logger.info(
+            f"Replaying {len(self.index)} chunks ({self.duration:.1f}s) "
+            f"from {self.path} at speed {self.speed or 'max'}")
+
+    def read_chunks(self) -> Generator[np.ndarray, None, None]:
+        """
+        Yield the captured chunks.
+
+        Yields:
+            numpy.ndarray: Read-only view of the chunk's samples
+        """
+        if not self.running:
+            raise RuntimeError("Replay not started. Call start() first.")
+
+        while self.running:
+            origin = time.monotonic()
+            for offset, samples, read_at, lag in self.index:
+                if self.speed > 0:
+                    arrived = max(0.0, read_at - lag)
+                    delay = origin + arrived / self.speed - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                if not self.running:
+                    return
+                if self.stream_origin is None:
+                    self.stream_origin = time.monotonic() - samples / self.sample_rate
+                self.samples_read += int(samples)
+                yield self.samples[offset:offset + samples]
+            if not self.loop:
+                return
+
+    def set_chunk_size(self, chunk_size: float) -> None:
+        """Ignored: replay keeps the recorded chunk boundaries."""
+        logger.debug(
+            f"Replay keeps recorded chunk boundaries, ignoring chunk size {chunk_size}")
+
+    @property
+    def lag(self) -> float:
+        """
+        Seconds the consumer is behind the replayed stream, as for a live
+        reader; always zero when replaying at maximum speed.
+        """
+        if self.stream_origin is None or self.speed <= 0:
+            return 0.0
+        elapsed = (time.monotonic() - self.stream_origin) * self.speed
+        return max(0.0, elapsed - self.samples_read / self.sample_rate)
+
+    def stop(self) -> None:
+        """Stop playback."""
+        self.running = False
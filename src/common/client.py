@@ -15,11 +15,21 @@ class ServiceClient:
         max_tries=3
     )
     async def request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        return await self._send(method, endpoint, **kwargs)
+
+    async def _send(self, method: str, endpoint: str, **kwargs: Any) -> Any:
         url = f"http://{self.config['host']}:{self.config['port']}{endpoint}"
-        async with self.client as client:
-            response = await client.request(method, url, **kwargs)
-            response.raise_for_status()
-            return response.json()
+        # Reuse the pooled client; closing it here would break later calls
+        response = await self.client.request(method, url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    async def health_check(self, retry: bool = True) -> Dict[str, Any]:
+        endpoint = self.config.get("health_check", "/health")
+        if retry:
+            return await self.request("GET", endpoint)
+        # Pollers re-check on their own schedule, so fail fast instead
+        return await self._send("GET", endpoint)
 
-    async def health_check(self) -> Dict[str, Any]:
-        return await self.request("GET", "/health")
\ No newline at end of file
+    async def close(self) -> None:
+        await self.client.aclose()
\ No newline at end of file
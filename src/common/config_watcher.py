@@ -0,0 +1,129 @@
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import yaml
+
+logger = logging.getLogger("voxbridge.config_watcher")
+
+
+def validate_config(config: Any) -> None:
+    """
+    Check the overall shape of a VoxBridge configuration.
+
+    Raises:
+        ValueError: If the configuration is not usable
+    """
+    if not isinstance(config, dict):
+        raise ValueError("Configuration must be a mapping")
+
+    for section in ("services", "stt", "translation", "tts", "streaming", "admin"):
+        if section in config and not isinstance(config[section], dict):
+            raise ValueError(f"'{section}' must be a mapping")
+
+    rtmp = config.get("stt", {}).get("rtmp", {})
+    if not isinstance(rtmp, dict):
+        raise ValueError("'stt.rtmp' must be a mapping")
+    for key in ("sample_rate", "chunk_size"):
+        value = rtmp.get(key)
+        if value is not None and (not isinstance(value, (int, float)) or value <= 0):
+            raise ValueError(f"'stt.rtmp.{key}' must be a positive number")
+
+
+class ConfigWatcher:
+    """
+    Watches a YAML config file and reports validated changes.
+
+    Polls the file's modification time on a background thread. When it
+    changes, the file is parsed and validated; a valid config is passed to
+    the callback, an invalid one is logged and ignored so the service keeps
+    running on the last good configuration.
+    """
+
+    def __init__(self, path: Union[str, Path],
+                 on_change: Callable[[Dict[str, Any], Dict[str, Any]], None],
+                 config: Dict[str, Any],
+                 validate: Callable[[Any], None] = validate_config,
+                 interval: float = 2.0):
+        """
+        Initialize the config watcher.
+
+        Args:
+            path: Path of the YAML file to watch
+            on_change: Called with (old_config, new_config) after a valid change
+            config: The configuration currently in use
+            validate: Raises ValueError for an unusable config
+            interval: Seconds between modification checks (default: 2)
+        """
+        self.path = Path(path)
+        self.on_change = on_change
+        self.config = config
+        self.validate = validate
+        self.interval = interval
+        self.reloads = 0
+        self.rejected = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._signature = self._stat()
+
+    def _stat(self) -> Optional[Tuple[float, int]]:
+        try:
+            stat = os.stat(self.path)
+            return stat.st_mtime, stat.st_size
+        except OSError:
+            return None
+
+    def start(self) -> None:
+        """Start watching in a background thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"Watching {self.path} for changes every {self.interval}s")
+
+    def stop(self) -> None:
+        """Stop watching."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            signature = self._stat()
+            if signature is None or signature == self._signature:
+                continue
+            # Editors often write in several steps; wait for the file to settle
+            if self._stop.wait(0.2) or self._stat() != signature:
+                continue
+            self._signature = signature
+            self.check()
+
+    def check(self) -> bool:
+        """
+        Load, validate and apply the file now.
+
+        Returns:
+            bool: True if a new configuration was applied
+        """
+        try:
+            with open(self.path) as f:
+                new_config = yaml.safe_load(f)
+            self.validate(new_config)
+        except Exception as e:
+            self.rejected += 1
+            logger.error(f"Ignoring invalid configuration in {self.path}: {e}")
+            return False
+
+        if new_config == self.config:
+            return False
+
+        old_config, self.config = self.config, new_config
+        self.reloads += 1
+        logger.info(f"Configuration {self.path} changed, applying")
+        try:
+            self.on_change(old_config, new_config)
+        except Exception as e:
+            logger.error(f"Failed to apply configuration change: {e}", exc_info=True)
+        return True
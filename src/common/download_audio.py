@@ -1,18 +1,125 @@
 #!/usr/bin/env python3
 
+import hashlib
+import json
 import logging
 import os
+import shutil
 import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import ffmpeg
+from tqdm import tqdm
 from yt_dlp import YoutubeDL
 from yt_dlp.utils import DownloadError
 
 logger = logging.getLogger("voxbridge.download_audio")
 
 
+class AudioCache:
+    """
+    A content-addressed cache of converted audio files.
+
+    Entries are keyed by source URL and sample rate, stored as
+    ``<key>.wav`` with a ``<key>.json`` sidecar holding the title, and
+    evicted least-recently-used first once the cache grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path],
+                 max_bytes: int = 2_000_000_000):
+        """
+        Initialize the audio cache.
+
+        Args:
+            cache_dir: Directory holding cached files
+            max_bytes: Maximum total size of cached audio (default: 2GB)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(url: str, sample_rate: int) -> str:
+        """Return the cache key for a URL converted at a given sample rate."""
+        return hashlib.sha256(f"{url}|{sample_rate}".encode()).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        return self.cache_dir / f"{key}.wav", self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Tuple[Path, Dict[str, Any]]]:
+        """
+        Look up a cached entry and mark it as recently used.
+
+        Returns:
+            Optional[Tuple[Path, dict]]: Audio path and metadata, or None on a miss
+        """
+        audio_path, meta_path = self._paths(key)
+        if not audio_path.exists():
+            return None
+
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = {}
+
+        # Access time is unreliable (noatime mounts), so bump mtime for LRU
+        now = time.time()
+        os.utime(audio_path, (now, now))
+        return audio_path, meta
+
+    def put(self, key: str, source: Union[str, Path],
+            meta: Dict[str, Any]) -> Path:
+        """
+        Move a converted file into the cache and evict old entries.
+
+        Args:
+            key: Cache key from AudioCache.key()
+            source: Path of the converted file; it is moved, not copied
+            meta: Metadata to store alongside the audio
+
+        Returns:
+            Path: Path of the cached audio file
+        """
+        audio_path, meta_path = self._paths(key)
+        with open(meta_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(source, audio_path)
+        self.evict(keep=key)
+        return audio_path
+
+    def size(self) -> int:
+        """Return the total size of cached audio in bytes."""
+        return sum(p.stat().st_size for p in self.cache_dir.glob("*.wav"))
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Remove least-recently-used entries until the cache fits max_bytes.
+
+        Args:
+            keep: Key that must not be evicted (typically the entry just added)
+        """
+        entries = sorted(
+            ((p.stat().st_mtime, p.stat().st_size, p)
+             for p in self.cache_dir.glob("*.wav")),
+            key=lambda e: e[0]
+        )
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path.stem == keep:
+                continue
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
+            logger.info(f"Evicted cached audio: {path.name}")
+
+
 class AudioDownloader:
     """
     A utility class for downloading audio from web sources and converting
@@ -20,18 +127,33 @@ class AudioDownloader:
     """
 
     def __init__(self, output_dir: Optional[Union[str, Path]] = None,
-                 sample_rate: int = 16000):
+                 sample_rate: int = 16000, stream: bool = False,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 cache_max_bytes: int = 2_000_000_000):
         """
         Initialize the audio downloader.
 
         Args:
             output_dir: Directory to save downloaded files (default: system temp dir)
             sample_rate: Target sample rate in Hz (default: 16kHz for STT)
+            stream: Download and convert in a single ffmpeg pass
+                instead of writing an intermediate WAV (default: False)
+            cache_dir: Optional directory for a content-addressed cache of
+                converted files, keyed by URL and sample rate
+            cache_max_bytes: Size cap of the cache before LRU eviction (default: 2GB)
         """
         self.output_dir = Path(output_dir) if output_dir else Path(
             tempfile.gettempdir())
         self.sample_rate = sample_rate
+        self.stream = stream
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.cache: Optional[AudioCache] = AudioCache(
+            cache_dir, cache_max_bytes) if cache_dir else None
+
+    def _output_path(self, title: str, output_name: Optional[str]) -> Path:
+        if output_name:
+            return self.output_dir / f"{output_name}.wav"
+        return self.output_dir / f"{title.replace(' ', '_')}.wav"
 
     def download(self, url: str, output_name: Optional[str] = None) -> str:
         """
@@ -44,6 +166,110 @@ class AudioDownloader:
         Returns:
             str: Path to the downloaded and converted audio file
         """
+        convert = self._download_streaming if self.stream else self._download_two_pass
+
+        if not self.cache:
+            return convert(url, output_name)[0]
+
+        key = AudioCache.key(url, self.sample_rate)
+        cached = self.cache.get(key)
+        if cached:
+            cached_path, meta = cached
+            output_file = self._output_path(
+                meta.get('title', 'downloaded_audio'), output_name)
+            shutil.copyfile(cached_path, output_file)
+            logger.info(f"Cache hit for {url}, audio saved to: {output_file}")
+            return str(output_file)
+
+        output_path, title = convert(url, output_name)
+        output_file = Path(output_path)
+        cached_path = self.cache.put(
+            key, self._copy_to_temp(output_file), {'url': url, 'title': title})
+        logger.info(f"Cached converted audio as {cached_path.name}")
+        return str(output_file)
+
+    def _copy_to_temp(self, path: Path) -> Path:
+        # Stage the copy inside the cache dir so put() can rename atomically
+        fd, temp_path = tempfile.mkstemp(suffix=".wav", dir=self.cache.cache_dir)
+        os.close(fd)
+        shutil.copyfile(path, temp_path)
+        return Path(temp_path)
+
+    def _download_streaming(self, url: str,
+                            output_name: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Download audio and resample it in a single ffmpeg pass.
+
+        The media URL is resolved with yt-dlp and handed to ffmpeg, which
+        downloads and decodes it as it goes, so the file is written only
+        once. ffmpeg fetches plain HTTP sources with Range requests, so
+        containers that need seeking (e.g. MP4 with the index at the end)
+        still decode.
+
+        Returns:
+            Tuple[str, str]: Path to the converted file and the source title
+        """
+        process = None
+        try:
+            ydl_opts = {
+                'format': 'bestaudio/best',
+                'quiet': True,
+                'no_warnings': True,
+            }
+
+            with YoutubeDL(ydl_opts) as ydl:
+                logger.info(f"Resolving audio stream for: {url}")
+                info = ydl.extract_info(url, download=False)
+
+            media_url = info['url']
+            headers = info.get('http_headers', {})
+            title = info.get('title', 'downloaded_audio')
+            output_file = self._output_path(title, output_name)
+            header_lines = ''.join(
+                f"{k}: {v}\r\n" for k, v in headers.items())
+            stream = ffmpeg.input(media_url, headers=header_lines)
+
+            stream = ffmpeg.output(
+                stream,
+                str(output_file),
+                acodec='pcm_s16le',  # 16-bit PCM
+                ac=1,                # mono
+                ar=self.sample_rate,  # target sample rate
+                loglevel='warning'
+            )
+
+            logger.info(
+                f"Streaming audio into {self.sample_rate}Hz mono WAV conversion")
+            process = stream.run_async(pipe_stderr=True, overwrite_output=True)
+            _, stderr = process.communicate()
+            if process.returncode != 0:
+                raise ffmpeg.Error('ffmpeg', None, stderr)
+
+            logger.info(f"Audio saved to: {output_file}")
+            return str(output_file), title
+
+        except DownloadError as e:
+            logger.error(f"Failed to download audio: {str(e)}")
+            raise
+        except ffmpeg.Error as e:
+            logger.error(
+                f"Failed to convert audio: {e.stderr.decode() if e.stderr else str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error: {str(e)}")
+            if process and process.poll() is None:
+                process.kill()
+                process.wait()
+            raise
+
+    def _download_two_pass(self, url: str,
+                           output_name: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Download audio to an intermediate WAV, then resample it with ffmpeg.
+
+        Returns:
+            Tuple[str, str]: Path to the converted file and the source title
+        """
         try:
             # First download the audio in best quality
             with tempfile.NamedTemporaryFile(suffix=".%(ext)s", delete=False) as tf:
@@ -64,36 +290,22 @@ class AudioDownloader:
             with YoutubeDL(ydl_opts) as ydl:
                 logger.info(f"Downloading audio from: {url}")
                 info = ydl.extract_info(url, download=True)
-                title = info.get('title', 'downloaded_audio').replace(' ', '_')
+                title = info.get('title', 'downloaded_audio')
 
             # The actual downloaded file path (with proper extension)
             downloaded_file = temp_path.replace("%(ext)s", "wav")
 
             # Determine output path
-            if output_name:
-                output_file = self.output_dir / f"{output_name}.wav"
-            else:
-                output_file = self.output_dir / f"{title}.wav"
+            output_file = self._output_path(title, output_name)
 
             # Convert to proper format using ffmpeg
-            stream = ffmpeg.input(downloaded_file)
-            stream = ffmpeg.output(
-                stream,
-                str(output_file),
-                acodec='pcm_s16le',  # 16-bit PCM
-                ac=1,                # mono
-                ar=self.sample_rate,  # target sample rate
-                loglevel='warning'
-            )
-
-            logger.info(f"Converting audio to {self.sample_rate}Hz mono WAV")
-            ffmpeg.run(stream, overwrite_output=True)
+            self._transcode(downloaded_file, output_file)
 
             # Clean up temporary file
             os.unlink(downloaded_file)
 
             logger.info(f"Audio saved to: {output_file}")
-            return str(output_file)
+            return str(output_file), title
 
         except DownloadError as e:
             logger.error(f"Failed to download audio: {str(e)}")
@@ -106,10 +318,197 @@ class AudioDownloader:
             logger.error(f"Unexpected error: {str(e)}")
             raise
 
+    def _fetch(self, url: str, work_dir: Path) -> Tuple[str, str]:
+        """
+        Download the best audio stream of a URL as-is, without converting it.
+
+        Returns:
+            Tuple[str, str]: Path to the downloaded file and the source title
+        """
+        ydl_opts = {
+            'format': 'bestaudio/best',
+            'outtmpl': str(work_dir / f"{AudioCache.key(url, 0)}.%(ext)s"),
+            'quiet': True,
+            'no_warnings': True,
+        }
+
+        with YoutubeDL(ydl_opts) as ydl:
+            logger.info(f"Downloading audio from: {url}")
+            info = ydl.extract_info(url, download=True)
+            return ydl.prepare_filename(info), info.get('title', 'downloaded_audio')
+
+    def _transcode(self, source: Union[str, Path], output_file: Path) -> Path:
+        """Convert an audio file to mono 16-bit PCM WAV at the target rate."""
+        stream = ffmpeg.input(str(source))
+        stream = ffmpeg.output(
+            stream,
+            str(output_file),
+            acodec='pcm_s16le',  # 16-bit PCM
+            ac=1,                # mono
+            ar=self.sample_rate,  # target sample rate
+            loglevel='warning'
+        )
+
+        logger.info(f"Converting audio to {self.sample_rate}Hz mono WAV")
+        ffmpeg.run(stream, overwrite_output=True, capture_stderr=True)
+        return output_file
+
+    def download_many(self, items: Sequence[Union[str, Dict[str, str]]],
+                      max_downloads: int = 4,
+                      max_transcodes: Optional[int] = None,
+                      retries: int = 2,
+                      manifest_path: Optional[Union[str, Path]] = None
+                      ) -> List[Dict[str, Any]]:
+        """
+        Download and convert a batch of URLs in parallel.
+
+        Downloads run in a bounded thread pool; the ffmpeg transcodes run in a
+        separate pool sized to the number of cores. Progress is recorded in a
+        summary manifest after every item, so re-running the same batch skips
+        entries that already completed.
+
+        Args:
+            items: URLs, or dicts with a 'url' and optional 'name' key
+            max_downloads: Maximum concurrent downloads (default: 4)
+            max_transcodes: Maximum concurrent transcodes (default: CPU count)
+            retries: Extra attempts per item after a failure (default: 2)
+            manifest_path: Summary manifest location
+                (default: manifest.json in the output directory)
+
+        Returns:
+            List[dict]: One manifest entry per distinct URL with url, name,
+            path, status, attempts and error
+        """
+        manifest_file = Path(manifest_path) if manifest_path else \
+            self.output_dir / "manifest.json"
+        previous = {}
+        if manifest_file.exists():
+            with open(manifest_file) as f:
+                previous = {e['url']: e for e in json.load(f)}
+
+        entries: List[Dict[str, Any]] = []
+        seen = set()
+        for item in items:
+            if isinstance(item, str):
+                item = {'url': item}
+            # A repeated URL would be fetched and transcoded to the same
+            # files twice at once; only its first occurrence is downloaded
+            if item['url'] in seen:
+                logger.warning(f"Skipping duplicate URL in batch: {item['url']}")
+                continue
+            seen.add(item['url'])
+            entry = previous.get(item['url'])
+            if not (entry and entry['status'] == 'ok' and entry['path']
+                    and Path(entry['path']).exists()):
+                entry = {'url': item['url'], 'name': item.get('name'),
+                         'path': None, 'status': 'pending', 'attempts': 0,
+                         'error': None}
+            entries.append(entry)
+
+        def output_path(entry: Dict[str, Any], title: str) -> Path:
+            # Titles repeat across a batch (e.g. "Sunday Service"); suffix a
+            # hash of the URL so concurrent transcodes never share a file
+            if entry['name']:
+                return self._output_path(title, entry['name'])
+            url_hash = AudioCache.key(entry['url'], 0)[:8]
+            return self._output_path(f"{title}_{url_hash}", None)
+
+        if self.cache:
+            for entry in entries:
+                if entry['status'] == 'ok':
+                    continue
+                cached = self.cache.get(
+                    AudioCache.key(entry['url'], self.sample_rate))
+                if cached:
+                    cached_path, meta = cached
+                    output_file = output_path(
+                        entry, meta.get('title', 'downloaded_audio'))
+                    shutil.copyfile(cached_path, output_file)
+                    entry.update(path=str(output_file), status='ok',
+                                 title=meta.get('title'))
+
+        todo = [e for e in entries if e['status'] != 'ok']
+        logger.info(
+            f"Batch of {len(entries)} items, {len(entries) - len(todo)} already done")
+
+        def write_manifest() -> None:
+            temp_file = manifest_file.with_suffix(".tmp")
+            with open(temp_file, "w") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(temp_file, manifest_file)
+
+        with tempfile.TemporaryDirectory(dir=self.output_dir) as work_dir, \
+                ThreadPoolExecutor(max_downloads) as download_pool, \
+                ThreadPoolExecutor(max_transcodes or os.cpu_count()) as transcode_pool, \
+                tqdm(total=len(entries), initial=len(entries) - len(todo),
+                     unit="file", desc="Downloading") as progress:
+
+            pending: Dict[Future, Tuple[str, Dict[str, Any], Optional[str]]] = {}
+
+            def submit_fetch(entry: Dict[str, Any]) -> None:
+                entry['attempts'] += 1
+                future = download_pool.submit(
+                    self._fetch, entry['url'], Path(work_dir))
+                pending[future] = ('fetch', entry, None)
+
+            for entry in todo:
+                submit_fetch(entry)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, entry, raw_file = pending.pop(future)
+                    try:
+                        if stage == 'fetch':
+                            raw_file, title = future.result()
+                            output_file = output_path(entry, title)
+                            entry['title'] = title
+                            next_future = transcode_pool.submit(
+                                self._transcode, raw_file, output_file)
+                            pending[next_future] = ('transcode', entry, raw_file)
+                            continue
+
+                        output_file = future.result()
+                        entry.update(path=str(output_file), status='ok',
+                                     error=None)
+                        os.unlink(raw_file)
+                        if self.cache:
+                            self.cache.put(
+                                AudioCache.key(entry['url'], self.sample_rate),
+                                self._copy_to_temp(output_file),
+                                {'url': entry['url'], 'title': entry['title']})
+                    except Exception as e:
+                        if raw_file and os.path.exists(raw_file):
+                            os.unlink(raw_file)
+                        entry['error'] = e.stderr.decode() \
+                            if isinstance(e, ffmpeg.Error) and e.stderr else str(e)
+                        if entry['attempts'] <= retries:
+                            logger.warning(
+                                f"Attempt {entry['attempts']} failed for "
+                                f"{entry['url']}, retrying: {e}")
+                            submit_fetch(entry)
+                            continue
+                        entry['status'] = 'failed'
+                        logger.error(
+                            f"Giving up on {entry['url']} after "
+                            f"{entry['attempts']} attempts: {e}")
+
+                    progress.update(1)
+                    write_manifest()
+
+        write_manifest()
+        failed = sum(1 for e in entries if e['status'] == 'failed')
+        logger.info(
+            f"Batch finished: {len(entries) - failed} ok, {failed} failed, "
+            f"manifest written to {manifest_file}")
+        return entries
+
 
 def download_audio(url: str, output_dir: Optional[str] = None,
                    output_name: Optional[str] = None,
-                   sample_rate: int = 16000) -> str:
+                   sample_rate: int = 16000, stream: bool = False,
+                   cache_dir: Optional[str] = None,
+                   cache_max_bytes: int = 2_000_000_000) -> str:
     """
     Convenience function to download audio from a URL.
 
@@ -118,14 +517,85 @@ def download_audio(url: str, output_dir: Optional[str] = None,
         output_dir: Optional directory to save the file
         output_name: Optional name for the output file (without extension)
         sample_rate: Target sample rate in Hz (default: 16kHz)
+        stream: Convert in a single streaming ffmpeg pass (default: False)
+        cache_dir: Optional directory for the converted audio cache
+        cache_max_bytes: Size cap of the cache in bytes (default: 2GB)
 
     Returns:
         str: Path to the downloaded and converted audio file
     """
-    downloader = AudioDownloader(output_dir, sample_rate)
+    downloader = AudioDownloader(output_dir, sample_rate, stream=stream,
+                                 cache_dir=cache_dir,
+                                 cache_max_bytes=cache_max_bytes)
     return downloader.download(url, output_name)
 
 
+def load_url_list(path: Union[str, Path]) -> List[Dict[str, str]]:
+    """
+    Load a batch of URLs from a manifest file.
+
+    JSON files hold a list of URL strings or {"url", "name"} objects; any
+    other file is read as one URL per line, optionally followed by an output
+    name. Blank lines and lines starting with '#' are ignored.
+
+    Args:
+        path: Path to the URL list or manifest file
+
+    Returns:
+        List[dict]: Items with a 'url' and optional 'name' key
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path) as f:
+            return [{'url': i} if isinstance(i, str) else i for i in json.load(f)]
+
+    items = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = line.split(maxsplit=1)
+            items.append({'url': parts[0], 'name': parts[1] if len(parts) > 1 else None})
+    return items
+
+
+def download_many(items: Sequence[Union[str, Dict[str, str]]],
+                  output_dir: Optional[str] = None,
+                  sample_rate: int = 16000,
+                  max_downloads: int = 4,
+                  max_transcodes: Optional[int] = None,
+                  retries: int = 2,
+                  cache_dir: Optional[str] = None,
+                  cache_max_bytes: int = 2_000_000_000,
+                  manifest_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Convenience function to download and convert a batch of URLs.
+
+    Args:
+        items: URLs, or dicts with a 'url' and optional 'name' key
+        output_dir: Optional directory to save the files and manifest
+        sample_rate: Target sample rate in Hz (default: 16kHz)
+        max_downloads: Maximum concurrent downloads (default: 4)
+        max_transcodes: Maximum concurrent transcodes (default: CPU count)
+        retries: Extra attempts per item after a failure (default: 2)
+        cache_dir: Optional directory for the converted audio cache
+        cache_max_bytes: Size cap of the cache in bytes (default: 2GB)
+        manifest_path: Summary manifest location
+            (default: manifest.json in the output directory)
+
+    Returns:
+        List[dict]: The summary manifest entries
+    """
+    downloader = AudioDownloader(output_dir, sample_rate,
+                                 cache_dir=cache_dir,
+                                 cache_max_bytes=cache_max_bytes)
+    return downloader.download_many(items, max_downloads=max_downloads,
+                                    max_transcodes=max_transcodes,
+                                    retries=retries,
+                                    manifest_path=manifest_path)
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -139,22 +609,61 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Download audio from a web source and convert for RTMP streaming"
     )
-    parser.add_argument("url", help="URL of the audio source")
+    parser.add_argument("url", nargs="?", help="URL of the audio source")
+    parser.add_argument(
+        "--batch", help="File with URLs to download (one per line, or a JSON list)")
     parser.add_argument(
         "--output-dir", help="Directory to save the downloaded file")
     parser.add_argument(
         "--output-name", help="Name for the output file (without extension)")
     parser.add_argument("--sample-rate", type=int, default=16000,
                         help="Target sample rate in Hz")
+    parser.add_argument("--stream", action="store_true",
+                        help="Pipe the download into a single ffmpeg pass")
+    parser.add_argument(
+        "--cache-dir", help="Directory for caching converted audio")
+    parser.add_argument("--cache-size-mb", type=int, default=2000,
+                        help="Maximum cache size in MB before LRU eviction")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Concurrent downloads in batch mode")
+    parser.add_argument("--transcode-workers", type=int,
+                        help="Concurrent transcodes in batch mode (default: CPU count)")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="Retries per item in batch mode")
+    parser.add_argument(
+        "--manifest", help="Summary manifest for batch mode "
+                           "(default: manifest.json in the output directory)")
 
     args = parser.parse_args()
 
+    if not args.url and not args.batch:
+        parser.error("either a URL or --batch is required")
+
     try:
+        if args.batch:
+            entries = download_many(
+                load_url_list(args.batch),
+                output_dir=args.output_dir,
+                sample_rate=args.sample_rate,
+                max_downloads=args.workers,
+                max_transcodes=args.transcode_workers,
+                retries=args.retries,
+                cache_dir=args.cache_dir,
+                cache_max_bytes=args.cache_size_mb * 1_000_000,
+                manifest_path=args.manifest
+            )
+            failed = [e for e in entries if e['status'] != 'ok']
+            print(f"Downloaded {len(entries) - len(failed)}/{len(entries)} files")
+            exit(1 if failed else 0)
+
         output_file = download_audio(
             args.url,
             output_dir=args.output_dir,
             output_name=args.output_name,
-            sample_rate=args.sample_rate
+            sample_rate=args.sample_rate,
+            stream=args.stream,
+            cache_dir=args.cache_dir,
+            cache_max_bytes=args.cache_size_mb * 1_000_000
         )
         print(f"Successfully downloaded and converted: {output_file}")
     except Exception as e:
@@ -0,0 +1,117 @@
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    A QueueHandler that never blocks the calling thread.
+
+    Records are put on a bounded queue without waiting; when the queue is
+    full the record is discarded and counted instead, so a slow disk can
+    only lose log lines, never stall the audio loop.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def setup_queued_logging(logger: logging.Logger, handlers: List[logging.Handler],
+                         queue_size: int = 10000
+                         ) -> Tuple[DroppingQueueHandler, logging.handlers.QueueListener]:
+    """
+    Route a logger through a bounded queue to handlers on a background thread.
+
+    The logger stops propagating to the root logger; the root handlers are
+    added to the listener instead so console output is also written off
+    the calling thread.
+
+    Args:
+        logger: Logger to attach the queue handler to
+        handlers: Handlers that do the actual (blocking) output
+        queue_size: Maximum records buffered before new ones are dropped
+
+    Returns:
+        Tuple[DroppingQueueHandler, QueueListener]: The handler (with its
+        dropped-record count) and the started listener
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = DroppingQueueHandler(log_queue)
+
+    listener_handlers = list(handlers) + logging.getLogger().handlers
+    listener = logging.handlers.QueueListener(
+        log_queue, *listener_handlers, respect_handler_level=True)
+    listener.start()
+
+    logger.addHandler(queue_handler)
+    logger.propagate = False
+    return queue_handler, listener
+
+
+class ThrottledLogger:
+    """
+    Wraps a logger for events that fire on every audio chunk.
+
+    Emits at most one record per `interval` seconds and/or one in every
+    `every` calls, appending how many were suppressed since the last one.
+    Each message format string is throttled independently. The level is
+    checked before anything else, so a disabled level costs no formatting.
+    """
+
+    def __init__(self, logger: logging.Logger, interval: Optional[float] = 5.0,
+                 every: Optional[int] = None):
+        """
+        Initialize the throttled logger.
+
+        Args:
+            logger: Logger to emit records to
+            interval: Minimum seconds between emitted records (default: 5)
+            every: Emit only every Nth call (default: None, no sampling)
+        """
+        self.logger = logger
+        self.interval = interval
+        self.every = every
+        self._lock = threading.Lock()
+        # Per message: [calls, suppressed, last emit time]
+        self._state: Dict[str, List[Any]] = {}
+
+    def log(self, level: int, msg: str, *args: Any) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+
+        with self._lock:
+            state = self._state.setdefault(msg, [0, 0, float("-inf")])
+            state[0] += 1
+            now = time.monotonic()
+            if (self.every and (state[0] - 1) % self.every) or \
+                    (self.interval and now - state[2] < self.interval):
+                state[1] += 1
+                return
+            suppressed, state[1] = state[1], 0
+            state[2] = now
+
+        if suppressed:
+            msg = f"{msg} ({suppressed} similar messages suppressed)"
+        self.logger.log(level, msg, *args)
+
+    def debug(self, msg: str, *args: Any) -> None:
+        self.log(logging.DEBUG, msg, *args)
+
+    def info(self, msg: str, *args: Any) -> None:
+        self.log(logging.INFO, msg, *args)
+
+    def warning(self, msg: str, *args: Any) -> None:
+        self.log(logging.WARNING, msg, *args)
+
+    def error(self, msg: str, *args: Any) -> None:
+        self.log(logging.ERROR, msg, *args)
@@ -0,0 +1,256 @@
+import linecache
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def _frame_label(code: Any) -> str:
+    return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+
+
+class Profiler:
+    """
+    On-demand diagnostics for a running service.
+
+    Only one profile runs at a time and nothing is collected between
+    requests. Stack sampling is capped at max_duration and its interval
+    has a floor, so it costs a few percent of one core at most. Memory
+    tracing slows down every allocation in the process while it is on,
+    so its window has a separate, shorter cap (max_memory_duration).
+    """
+
+    def __init__(self, max_duration: float = 60.0, min_interval: float = 0.001,
+                 max_stacks: int = 5000, max_memory_duration: float = 10.0):
+        """
+        Initialize the profiler.
+
+        Args:
+            max_duration: Longest profile allowed, in seconds (default: 60)
+            min_interval: Shortest stack sampling interval, in seconds (default: 1 ms)
+            max_stacks: Distinct stacks kept; further ones are counted
+                as "[truncated]" (default: 5000)
+            max_memory_duration: Longest memory tracing window, in seconds
+                (default: 10)
+        """
+        self.max_duration = max_duration
+        self.max_memory_duration = max_memory_duration
+        self.min_interval = min_interval
+        self.max_stacks = max_stacks
+        self._busy = threading.Lock()
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        if not self._busy.acquire(blocking=False):
+            raise ProfilerBusyError("Another profile is already running")
+        try:
+            yield
+        finally:
+            self._busy.release()
+
+    def sample_stacks(self, duration: float, interval: float = 0.005,
+                      thread_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Sample the call stacks of running threads.
+
+        Args:
+            duration: Seconds to sample for, capped at max_duration
+            interval: Seconds between samples, at least min_interval
+            thread_id: Only sample this thread (e.g. the service loop);
+                all threads are sampled, prefixed by thread name, if None
+
+        Returns:
+            dict: Sample count, effective duration and interval, and
+            "stacks" mapping each collapsed stack ("outer;...;inner",
+            root first) to the number of samples it was seen in
+
+        Raises:
+            ProfilerBusyError: If another profile is running
+        """
+        duration = min(max(duration, 0.0), self.max_duration)
+        interval = max(interval, self.min_interval)
+
+        with self._exclusive():
+            own_id = threading.get_ident()
+            names = {t.ident: t.name for t in threading.enumerate()}
+            labels: Dict[Any, str] = {}
+            stacks: Counter = Counter()
+            samples = 0
+            started = time.monotonic()
+            deadline = started + duration
+
+            while time.monotonic() < deadline:
+                for ident, frame in sys._current_frames().items():
+                    if ident == own_id or (thread_id is not None and ident != thread_id):
+                        continue
+                    parts: List[str] = []
+                    while frame is not None:
+                        code = frame.f_code
+                        label = labels.get(code)
+                        if label is None:
+                            label = labels[code] = _frame_label(code)
+                        parts.append(label)
+                        frame = frame.f_back
+                    if thread_id is None:
+                        parts.append(names.get(ident, str(ident)))
+                    stack = ";".join(reversed(parts))
+                    if stack in stacks or len(stacks) < self.max_stacks:
+                        stacks[stack] += 1
+                    else:
+                        stacks["[truncated]"] += 1
+                samples += 1
+                time.sleep(interval)
+
+        return {
+            "samples": samples,
+            "duration": round(time.monotonic() - started, 3),
+            "interval": interval,
+            "stacks": dict(stacks.most_common()),
+        }
+
+    def memory_diff(self, duration: float, top: int = 25, frames: int = 10,
+                    group_by: str = "lineno") -> Dict[str, Any]:
+        """
+        Compare heap allocations at the start and end of a time window.
+
+        Tracing is only switched on for the window (unless it was already
+        on), since tracemalloc slows down every allocation while active.
+        Only memory allocated during the window can be attributed.
+
+        Args:
+            duration: Seconds between the snapshots, capped at max_memory_duration
+            top: Number of allocation sites to report (default: 25)
+            frames: Frames stored per allocation traceback (default: 10)
+            group_by: "lineno", "filename" or "traceback" (default: "lineno")
+
+        Returns:
+            dict: Net growth over the window and the allocation sites that
+            grew or shrank the most
+
+        Raises:
+            ProfilerBusyError: If another profile is running
+        """
+        duration = min(max(duration, 0.0), self.max_memory_duration)
+
+        with self._exclusive():
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start(frames)
+            try:
+                before = tracemalloc.take_snapshot()
+                time.sleep(duration)
+                after = tracemalloc.take_snapshot()
+                traced, peak = tracemalloc.get_traced_memory()
+            finally:
+                if started_tracing:
+                    tracemalloc.stop()
+
+        ignore = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, linecache.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ]
+        diff = after.filter_traces(ignore).compare_to(
+            before.filter_traces(ignore), group_by)
+
+        return {
+            "duration": duration,
+            "traced_bytes": traced,
+            "peak_bytes": peak,
+            "size_diff": sum(stat.size_diff for stat in diff),
+            "count_diff": sum(stat.count_diff for stat in diff),
+            "top": [
+                {
+                    "size_diff": stat.size_diff,
+                    "count_diff": stat.count_diff,
+                    "size": stat.size,
+                    "count": stat.count,
+                    "traceback": [str(frame) for frame in stat.traceback],
+                }
+                for stat in diff[:top]
+            ],
+        }
+
+
+class StageTimer:
+    """
+    Cumulative timing of the named stages of a service loop.
+
+    Adds two perf_counter() calls per stage, so it stays on all the time;
+    percentiles are computed over the most recent `window` runs of each stage.
+    """
+
+    def __init__(self, window: int = 1000):
+        """
+        Initialize the stage timer.
+
+        Args:
+            window: Recent durations kept per stage for percentiles (default: 1000)
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self.since = time.time()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one run of a stage."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record one run of a stage."""
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = {
+                    "count": 0, "total": 0.0, "max": 0.0,
+                    "recent": deque(maxlen=self.window),
+                }
+            stats["count"] += 1
+            stats["total"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+            stats["recent"].append(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns:
+            dict: Per stage run count, total seconds, share of the time
+            spent in all stages, and mean, p50, p95 and max in milliseconds
+        """
+        with self._lock:
+            stages = {name: dict(stats, recent=list(stats["recent"]))
+                      for name, stats in self._stages.items()}
+
+        overall = sum(stats["total"] for stats in stages.values()) or 1.0
+        report = {}
+        for name, stats in stages.items():
+            recent: List[float] = stats["recent"]
+            report[name] = {
+                "count": stats["count"],
+                "total_s": round(stats["total"], 3),
+                "share": round(stats["total"] / overall, 4),
+                "mean_ms": round(stats["total"] / stats["count"] * 1000, 3),
+                "p50_ms": round(float(np.percentile(recent, 50)) * 1000, 3),
+                "p95_ms": round(float(np.percentile(recent, 95)) * 1000, 3),
+                "max_ms": round(stats["max"] * 1000, 3),
+            }
+        return {"since": self.since, "stages": report}
+
+    def reset(self) -> None:
+        """Forget all recorded timings."""
+        with self._lock:
+            self._stages.clear()
+            self.since = time.time()
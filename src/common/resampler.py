@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+import logging
+from functools import lru_cache
+from math import gcd
+from typing import Dict, Iterable
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+logger = logging.getLogger("voxbridge.resampler")
+
+
+@lru_cache(maxsize=32)
+def _filter_bank(up: int, down: int, zero_crossings: int,
+                 beta: float) -> np.ndarray:
+    """
+    Design the polyphase filter bank for a reduced up/down ratio.
+
+    A Kaiser-windowed sinc low-pass at the lower of the two Nyquist rates is
+    designed at the upsampled rate and split into `up` phases. Each row is
+    stored reversed so it can be applied directly to a window of consecutive
+    input samples. Banks are cached per ratio, so every resampler with the
+    same conversion shares one read-only copy.
+
+    Returns:
+        np.ndarray: Array of shape (up, taps_per_phase), float32
+    """
+    max_rate = max(up, down)
+    taps_per_phase = 2 * int(np.ceil(zero_crossings * max_rate / up))
+    num_taps = taps_per_phase * up
+
+    # Cutoff in cycles per upsampled sample
+    cutoff = 0.5 / max_rate
+    n = np.arange(num_taps) - (num_taps - 1) / 2
+    h = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(num_taps, beta)
+    # Compensate for the zeros inserted by upsampling
+    h *= up / h.sum() if h.sum() else 1.0
+
+    # Phase p holds h[p], h[p + up], h[p + 2*up], ...; reverse for dot products
+    bank = h.reshape(taps_per_phase, up).T[:, ::-1]
+    bank = np.ascontiguousarray(bank, dtype=np.float32)
+    bank.flags.writeable = False
+    return bank
+
+
+class PolyphaseResampler:
+    """
+    A streaming polyphase resampler for mono PCM chunks.
+
+    Converts between any two integer sample rates using a rational up/down
+    factor. The filter history and output phase are carried across calls to
+    process(), so feeding a stream in arbitrary chunk sizes produces the same
+    output as resampling it in one piece.
+    """
+
+    def __init__(self, in_rate: int, out_rate: int, zero_crossings: int = 10,
+                 beta: float = 5.0):
+        """
+        Initialize the resampler.
+
+        Args:
+            in_rate: Input sample rate in Hz
+            out_rate: Output sample rate in Hz
+            zero_crossings: Sinc zero crossings on each side of the filter;
+                higher is sharper but slower (default: 10)
+            beta: Kaiser window shape parameter (default: 5.0)
+        """
+        if in_rate <= 0 or out_rate <= 0:
+            raise ValueError("Sample rates must be positive")
+
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        divisor = gcd(in_rate, out_rate)
+        self.up = out_rate // divisor
+        self.down = in_rate // divisor
+        self.passthrough = self.up == self.down
+        self.bank = _filter_bank(self.up, self.down, zero_crossings, beta)
+        self.taps = self.bank.shape[1]
+        self.reset()
+
+    @property
+    def latency(self) -> float:
+        """Group delay of the filter in seconds."""
+        if self.passthrough:
+            return 0.0
+        return (self.taps * self.up - 1) / 2 / (self.in_rate * self.up)
+
+    def reset(self) -> None:
+        """Clear the filter history, e.g. after a stream reconnect."""
+        self._history = np.zeros(self.taps - 1, dtype=np.float32)
+        # Position of the next output in upsampled samples, counted from the
+        # start of the history buffer
+        self._position = (self.taps - 1) * self.up
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        Resample the next chunk of the stream.
+
+        Args:
+            chunk: Mono float32 or int16 PCM samples at the input rate
+
+        Returns:
+            np.ndarray: Samples at the output rate, in the input dtype
+        """
+        if self.passthrough:
+            return chunk
+        if len(chunk) == 0:
+            return chunk[:0]
+
+        is_int = np.issubdtype(chunk.dtype, np.integer)
+        buffer = np.concatenate((self._history, chunk.astype(np.float32)))
+
+        # Outputs whose newest input sample is already in the buffer
+        end = len(buffer) * self.up
+        count = max(0, -(-(end - self._position) // self.down))
+        positions = self._position + self.down * np.arange(count)
+        newest = positions // self.up
+        phases = positions % self.up
+
+        windows = sliding_window_view(buffer, self.taps)[newest - (self.taps - 1)]
+        output = np.einsum("ij,ij->i", windows, self.bank[phases])
+
+        # Keep the tail as history and rebase the position onto it
+        kept = len(buffer) - (self.taps - 1)
+        self._history = buffer[kept:].copy()
+        self._position += count * self.down - kept * self.up
+
+        if is_int:
+            info = np.iinfo(chunk.dtype)
+            return np.clip(np.rint(output), info.min, info.max).astype(chunk.dtype)
+        return output.astype(chunk.dtype, copy=False)
+
+
+class RateFanout:
+    """
+    Feeds one decoded stream to consumers at several sample rates.
+
+    Holds one PolyphaseResampler per target rate, so a single RTMP decode can
+    serve engines or monitoring taps that expect different rates without
+    starting another ffmpeg process.
+    """
+
+    def __init__(self, in_rate: int, out_rates: Iterable[int], **kwargs):
+        """
+        Initialize the fan-out.
+
+        Args:
+            in_rate: Sample rate of the incoming stream in Hz
+            out_rates: Sample rates to produce
+            **kwargs: Additional arguments to pass to PolyphaseResampler
+        """
+        self.in_rate = in_rate
+        self.resamplers: Dict[int, PolyphaseResampler] = {
+            rate: PolyphaseResampler(in_rate, rate, **kwargs)
+            for rate in set(out_rates)
+        }
+        logger.info(
+            f"Resampling {in_rate}Hz to {sorted(self.resamplers)}Hz")
+
+    def process(self, chunk: np.ndarray) -> Dict[int, np.ndarray]:
+        """
+        Resample a chunk to every target rate.
+
+        Returns:
+            Dict[int, np.ndarray]: Resampled chunk keyed by sample rate
+        """
+        return {rate: resampler.process(chunk)
+                for rate, resampler in self.resamplers.items()}
+
+    def reset(self) -> None:
+        """Clear the history of every resampler."""
+        for resampler in self.resamplers.values():
+            resampler.reset()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+
+import json
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from src.common.rtmp_sender import RTMPSender
+
+logger = logging.getLogger("voxbridge.rtmp_load")
+
+
+class LoadStream:
+    """
+    A single publisher of the load generator.
+
+    Wraps an RTMPSender that loops one audio file in real time, restarts it
+    when it drops or when the chaos schedule disconnects it, and tracks
+    bitrate, drift and restart statistics from ffmpeg's progress reports.
+    """
+
+    def __init__(self, index: int, rtmp_url: str, audio_file: str,
+                 sample_rate: int = 16000, start_offset: float = 0.0,
+                 chaos_interval: Optional[float] = None,
+                 chaos_downtime: float = 2.0, reconnect_delay: float = 1.0,
+                 seed: Optional[int] = None):
+        """
+        Initialize a load stream.
+
+        Args:
+            index: Stream number, used in log messages
+            rtmp_url: URL to publish to
+            audio_file: Path to the audio file to loop
+            sample_rate: Target sample rate in Hz (default: 16kHz)
+            start_offset: Delay in seconds before the first publish
+            chaos_interval: Mean seconds between forced disconnects
+                (default: None, no chaos)
+            chaos_downtime: Seconds to stay disconnected after a forced drop
+            reconnect_delay: Seconds to wait before restarting a stream that
+                ended on its own
+            seed: Seed for the chaos schedule, so runs are reproducible
+        """
+        self.index = index
+        self.rtmp_url = rtmp_url
+        self.audio_file = audio_file
+        self.start_offset = start_offset
+        self.chaos_interval = chaos_interval
+        self.chaos_downtime = chaos_downtime
+        self.reconnect_delay = reconnect_delay
+        self.sender = RTMPSender(rtmp_url, sample_rate, realtime=True)
+        self.random = random.Random(seed)
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self._chaos_timer: Optional[threading.Timer] = None
+        self._chaos_triggered = False
+
+        self.restarts = 0
+        self.chaos_disconnects = 0
+        self.bytes_sent = 0
+        self.media_time = 0.0
+        self.connected_time = 0.0
+        self.bitrate_kbps = 0.0
+        self.drift = 0.0
+        self.max_drift = 0.0
+        self.speed = ""
+        self.connected = False
+
+    def start(self) -> None:
+        """Start publishing in a background thread."""
+        self.thread = threading.Thread(
+            target=self._run, name=f"rtmp-load-{self.index}", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop publishing and wait for the background thread to exit."""
+        self.stop_event.set()
+        if self._chaos_timer:
+            self._chaos_timer.cancel()
+        self.sender.stop()
+        if self.thread:
+            self.thread.join(timeout=5)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of this stream's statistics."""
+        return {
+            "stream": self.index,
+            "url": self.rtmp_url,
+            "connected": self.connected,
+            "restarts": self.restarts,
+            "chaos_disconnects": self.chaos_disconnects,
+            "bytes_sent": self.bytes_sent,
+            "media_time": round(self.media_time, 2),
+            "bitrate_kbps": round(self.bitrate_kbps, 1),
+            "drift": round(self.drift, 3),
+            "max_drift": round(self.max_drift, 3),
+            "speed": self.speed
+        }
+
+    def _schedule_chaos(self) -> None:
+        if not self.chaos_interval:
+            return
+        # Jitter the interval so streams don't all drop in lockstep
+        delay = self.random.uniform(
+            0.5 * self.chaos_interval, 1.5 * self.chaos_interval)
+        self._chaos_timer = threading.Timer(delay, self._disconnect)
+        self._chaos_timer.daemon = True
+        self._chaos_timer.start()
+
+    def _disconnect(self) -> None:
+        logger.info(f"Stream {self.index}: forcing disconnect")
+        self._chaos_triggered = True
+        self.chaos_disconnects += 1
+        self.sender.stop()
+
+    def _run(self) -> None:
+        if self.stop_event.wait(self.start_offset):
+            return
+
+        first = True
+        while not self.stop_event.is_set():
+            if not first:
+                self.restarts += 1
+            first = False
+            self._chaos_triggered = False
+
+            try:
+                self.sender.start(self.audio_file, loop=True, progress=True)
+            except Exception as e:
+                logger.error(f"Stream {self.index}: failed to start: {e}")
+                self.stop_event.wait(self.reconnect_delay)
+                continue
+
+            self.connected = True
+            self._schedule_chaos()
+            self._read_progress(time.monotonic())
+            self.connected = False
+
+            if self._chaos_timer:
+                self._chaos_timer.cancel()
+            self.sender.stop()
+
+            if self._chaos_triggered:
+                self.stop_event.wait(self.chaos_downtime)
+            elif not self.stop_event.is_set():
+                logger.warning(f"Stream {self.index}: publisher exited, restarting")
+                self.stop_event.wait(self.reconnect_delay)
+
+    def _read_progress(self, started: float) -> None:
+        """Consume ffmpeg progress reports until the publisher exits."""
+        process = self.sender.process
+        base_bytes = self.bytes_sent
+        base_media = self.media_time
+        base_connected = self.connected_time
+        report: Dict[str, str] = {}
+
+        for raw_line in iter(process.stdout.readline, b""):
+            key, _, value = raw_line.decode(errors="replace").strip().partition("=")
+            report[key] = value
+            if key != "progress":
+                continue
+
+            try:
+                out_time = int(report.get("out_time_us", "0")) / 1_000_000
+                size = int(report.get("total_size", "0"))
+            except ValueError:
+                # ffmpeg reports N/A until the first packet is written
+                continue
+
+            elapsed = time.monotonic() - started
+            self.bytes_sent = base_bytes + size
+            self.media_time = base_media + out_time
+            self.connected_time = base_connected + elapsed
+            self.bitrate_kbps = size * 8 / out_time / 1000 if out_time > 0 else 0.0
+            # Positive drift means the publisher is falling behind wall clock
+            self.drift = elapsed - out_time
+            self.max_drift = max(self.max_drift, self.drift)
+            self.speed = report.get("speed", "").strip()
+
+            if value == "end":
+                break
+
+
+class RTMPLoadGenerator:
+    """
+    Publishes several concurrent RTMP streams for soak and reconnection tests.
+
+    Each stream loops the same audio file at real-time pace to its own stream
+    key, derived from the base URL (rtmp://host/live/load -> .../load0,
+    .../load1, ...). Streams start staggered and can be disconnected on a
+    seeded chaos schedule to exercise reconnection under load.
+    """
+
+    def __init__(self, rtmp_url: str, audio_file: str, streams: int = 4,
+                 sample_rate: int = 16000, stagger: float = 1.0,
+                 chaos_interval: Optional[float] = None,
+                 chaos_downtime: float = 2.0, seed: Optional[int] = None):
+        """
+        Initialize the load generator.
+
+        Args:
+            rtmp_url: Base RTMP URL; the stream number is appended to it
+            audio_file: Path to the audio file each stream loops
+            streams: Number of concurrent streams (default: 4)
+            sample_rate: Target sample rate in Hz (default: 16kHz)
+            stagger: Seconds between the start of consecutive streams
+            chaos_interval: Mean seconds between forced disconnects per
+                stream (default: None, no chaos)
+            chaos_downtime: Seconds a stream stays down after a forced drop
+            seed: Seed for the chaos schedules, so runs are reproducible
+        """
+        base_seed = seed if seed is not None else random.randrange(2**32)
+        self.streams: List[LoadStream] = [
+            LoadStream(
+                i, f"{rtmp_url}{i}", audio_file,
+                sample_rate=sample_rate,
+                start_offset=i * stagger,
+                chaos_interval=chaos_interval,
+                chaos_downtime=chaos_downtime,
+                seed=base_seed + i
+            )
+            for i in range(streams)
+        ]
+
+    def start(self) -> None:
+        """Start all streams."""
+        logger.info(f"Starting {len(self.streams)} load streams")
+        for stream in self.streams:
+            stream.start()
+
+    def stop(self) -> None:
+        """Stop all streams."""
+        for stream in self.streams:
+            stream.stop()
+        logger.info("Load generator stopped")
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Return per-stream statistics."""
+        return [stream.stats() for stream in self.streams]
+
+    def run(self, duration: Optional[float] = None,
+            report_interval: float = 10.0) -> List[Dict[str, Any]]:
+        """
+        Run the load test, logging statistics periodically.
+
+        Args:
+            duration: Seconds to run for (default: until interrupted)
+            report_interval: Seconds between statistics reports
+
+        Returns:
+            List[dict]: Final per-stream statistics
+        """
+        self.start()
+        deadline = time.monotonic() + duration if duration else None
+        try:
+            while deadline is None or time.monotonic() < deadline:
+                wait = report_interval
+                if deadline is not None:
+                    wait = min(wait, max(0.0, deadline - time.monotonic()))
+                time.sleep(wait)
+                for stats in self.stats():
+                    logger.info(
+                        "Stream %d: connected=%s restarts=%d bitrate=%.1fkbps "
+                        "drift=%.3fs max_drift=%.3fs",
+                        stats["stream"], stats["connected"], stats["restarts"],
+                        stats["bitrate_kbps"], stats["drift"], stats["max_drift"]
+                    )
+        except KeyboardInterrupt:
+            logger.info("Load test interrupted by user")
+        finally:
+            self.stop()
+        return self.stats()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(
+        description="Publish concurrent RTMP streams for load testing")
+    parser.add_argument("audio_file", help="Path to the audio file to stream")
+    parser.add_argument("--rtmp-url", default="rtmp://localhost/live/load",
+                        help="Base RTMP URL; the stream number is appended")
+    parser.add_argument("--streams", type=int, default=4,
+                        help="Number of concurrent streams")
+    parser.add_argument("--sample-rate", type=int, default=16000,
+                        help="Target sample rate in Hz")
+    parser.add_argument("--stagger", type=float, default=1.0,
+                        help="Seconds between stream start times")
+    parser.add_argument("--duration", type=float,
+                        help="Seconds to run (default: until interrupted)")
+    parser.add_argument("--chaos-interval", type=float,
+                        help="Mean seconds between forced disconnects per stream")
+    parser.add_argument("--chaos-downtime", type=float, default=2.0,
+                        help="Seconds a stream stays down after a forced disconnect")
+    parser.add_argument("--seed", type=int,
+                        help="Seed for the chaos schedule")
+    parser.add_argument("--report-interval", type=float, default=10.0,
+                        help="Seconds between statistics reports")
+
+    args = parser.parse_args()
+
+    generator = RTMPLoadGenerator(
+        args.rtmp_url,
+        args.audio_file,
+        streams=args.streams,
+        sample_rate=args.sample_rate,
+        stagger=args.stagger,
+        chaos_interval=args.chaos_interval,
+        chaos_downtime=args.chaos_downtime,
+        seed=args.seed
+    )
+    print(json.dumps(generator.run(args.duration, args.report_interval), indent=2))
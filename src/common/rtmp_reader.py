@@ -1,14 +1,31 @@
 #!/usr/bin/env python3
 
 import logging
+import subprocess
 import time
-from typing import Generator, Optional
+from typing import Generator, List, Optional, Union
 
 import ffmpeg
 import numpy as np
 
+from src.common.capture import CaptureWriter
+
 logger = logging.getLogger("voxbridge.rtmp_reader")
 
+# Supported PCM output formats: ffmpeg codec and numpy dtype
+SAMPLE_FORMATS = {
+    'f32le': ('pcm_f32le', np.float32),  # 32-bit float in [-1.0, 1.0]
+    's16le': ('pcm_s16le', np.int16),    # 16-bit signed integer
+}
+
+
+# A read that blocks for longer than this fraction of the chunk's duration
+# waited for the source, which means no decoded audio was queued
+BLOCKED_READ_FRACTION = 0.25
+
+# Seconds to wait for ffmpeg to exit after terminating it before killing it
+PROCESS_STOP_TIMEOUT = 5.0
+
 
 class RTMPDisconnectedError(Exception):
     """Raised when RTMP stream is disconnected."""
@@ -22,7 +39,11 @@ class RTMPReader:
     """
 
     def __init__(self, rtmp_url: str, sample_rate: int = 16000, chunk_size: float = 0.5,
-                 reconnect_delay: float = 5.0, max_retries: int = 3):
+                 reconnect_delay: float = 5.0, max_retries: int = 3,
+                 sample_format: str = 'f32le',
+                 filters: Optional[Union[str, List[str]]] = None,
+                 capture: Optional[str] = None,
+                 capture_max_bytes: Optional[int] = None):
         """
         Initialize the RTMP reader.
 
@@ -30,14 +51,36 @@ class RTMPReader:
             rtmp_url: URL of the RTMP stream
             sample_rate: Target sample rate in Hz (default: 16kHz for most STT engines)
             chunk_size: Size of audio chunks in seconds (default: 0.5 seconds)
+            sample_format: PCM output format, 'f32le' or 's16le' (default: 'f32le')
+            filters: Optional ffmpeg audio filters run in the decoder process,
+                e.g. ["highpass=f=80", "dynaudnorm"]
+            capture: Record every chunk read to this path (without extension)
+                for replay with ReplayReader; for diagnostics only
+            capture_max_bytes: Stop recording once the capture reaches this size
         """
+        if sample_format not in SAMPLE_FORMATS:
+            raise ValueError(
+                f"Unsupported sample format '{sample_format}', "
+                f"expected one of {sorted(SAMPLE_FORMATS)}")
+
         self.rtmp_url = rtmp_url
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
+        self.sample_format = sample_format
+        self.codec, self.dtype = SAMPLE_FORMATS[sample_format]
+        if isinstance(filters, str):
+            filters = [filters]
+        self.filters = list(filters or [])
         self.process: Optional[ffmpeg.Stream] = None
+        # Wall-clock origin of the stream and audio consumed since, for lag
+        self.stream_origin: Optional[float] = None
+        self.samples_read = 0
         self.reconnect_delay = reconnect_delay
         self.max_retries = max_retries
         self.current_retries = 0
+        self.capture_path = capture
+        self.capture_max_bytes = capture_max_bytes
+        self.capture: Optional[CaptureWriter] = None
 
     def start(self, retry: bool = False) -> None:
         """Start reading from the RTMP stream."""
@@ -54,7 +97,14 @@ class RTMPReader:
 
         try:
             if self.process:
-                self.stop()
+                self._close_process()
+
+            if self.capture_path and not self.capture:
+                # One capture spans reconnects, so gaps show in its timing
+                self.capture = CaptureWriter(
+                    self.capture_path, self.sample_rate, self.sample_format,
+                    self.dtype, filters=self.filters,
+                    max_bytes=self.capture_max_bytes)
 
             # Set up ffmpeg stream with network-related options
             stream = ffmpeg.input(
@@ -67,23 +117,29 @@ class RTMPReader:
                 reconnect_streamed=1
             )
 
+            # Run DSP in the decoder process rather than in Python
+            output_args = {'af': ','.join(self.filters)} if self.filters else {}
+
             # Convert to PCM format with specified sample rate
             stream = ffmpeg.output(
                 stream,
                 'pipe:',
-                format='f32le',  # 32-bit float PCM
-                acodec='pcm_f32le',
+                format=self.sample_format,
+                acodec=self.codec,
                 ac=1,  # mono
                 ar=self.sample_rate,
                 # Include warning logs for better debugging
                 loglevel='warning',
                 # Additional options for better network handling
                 fflags='nobuffer',  # Reduce buffering
-                flags='low_delay'   # Minimize latency
+                flags='low_delay',  # Minimize latency
+                **output_args
             )
 
             # Start the process
             self.process = stream.run_async(pipe_stdout=True)
+            self.stream_origin = None
+            self.samples_read = 0
             logger.info(
                 f"Successfully connected to RTMP stream: {self.rtmp_url}")
 
@@ -101,28 +157,43 @@ class RTMPReader:
         Read audio chunks from the RTMP stream.
 
         Yields:
-            numpy.ndarray: Audio chunk as float32 PCM data
+            numpy.ndarray: Audio chunk as float32 or int16 PCM data,
+            depending on the configured sample format
         """
         if not self.process:
             raise RuntimeError("Stream not started. Call start() first.")
 
-        # Calculate chunk size in bytes
-        # 4 bytes per float32
-        chunk_bytes = int(self.sample_rate * self.chunk_size * 4)
+        itemsize = np.dtype(self.dtype).itemsize
 
         try:
             while True:
                 # Read chunk of raw bytes
                 try:
+                    # Recomputed per read so set_chunk_size() applies at
+                    # the next chunk boundary
+                    chunk_bytes = int(self.sample_rate * self.chunk_size) * itemsize
+                    read_started = time.monotonic()
                     raw_chunk = self.process.stdout.read(chunk_bytes)
+                    waited = time.monotonic() - read_started
                     if not raw_chunk:
                         raise RTMPDisconnectedError(
                             "Stream ended unexpectedly")
                 except (IOError, OSError) as e:
                     raise RTMPDisconnectedError(f"Stream read error: {str(e)}")
 
-                # Convert to numpy array of float32
-                chunk = np.frombuffer(raw_chunk, dtype=np.float32)
+                # Convert to numpy array of the configured sample type
+                chunk = np.frombuffer(raw_chunk, dtype=self.dtype)
+                self.samples_read += len(chunk)
+                duration = len(chunk) / self.sample_rate
+                if self.stream_origin is None or \
+                        waited > duration * BLOCKED_READ_FRACTION:
+                    # The read had to wait for audio, so none was queued:
+                    # re-anchor so source stalls and clock drift don't
+                    # turn into permanent lag
+                    self.stream_origin = time.monotonic() - \
+                        self.samples_read / self.sample_rate
+                if self.capture:
+                    self.capture.write(chunk, self.lag)
                 yield chunk
 
         except RTMPDisconnectedError as e:
@@ -136,13 +207,51 @@ class RTMPReader:
             self.stop()
             raise
 
+    def set_chunk_size(self, chunk_size: float) -> None:
+        """
+        Change the chunk duration; takes effect from the next chunk read.
+
+        Args:
+            chunk_size: New size of audio chunks in seconds
+        """
+        self.chunk_size = chunk_size
+
+    @property
+    def lag(self) -> float:
+        """
+        Seconds of live audio decoded but not yet read by the consumer.
+
+        Measured as wall-clock time since the stream origin minus the
+        duration of audio read since. The origin is re-anchored whenever a
+        read has to wait for the source, since the backlog is empty then;
+        zero before the first chunk arrives.
+        """
+        if self.stream_origin is None:
+            return 0.0
+        elapsed = time.monotonic() - self.stream_origin
+        return max(0.0, elapsed - self.samples_read / self.sample_rate)
+
     def stop(self) -> None:
         """Stop reading from the RTMP stream and clean up resources."""
+        self._close_process()
+        if self.capture:
+            self.capture.close()
+            self.capture = None
+
+    def _close_process(self) -> None:
         if self.process:
             try:
-                self.process.stdin.close()
+                # ffmpeg is started with only stdout piped
+                if self.process.stdin:
+                    self.process.stdin.close()
                 self.process.stdout.close()
-                self.process.wait()
+                self.process.terminate()
+                try:
+                    self.process.wait(timeout=PROCESS_STOP_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    logger.warning("ffmpeg did not exit, killing it")
+                    self.process.kill()
+                    self.process.wait()
                 logger.info("RTMP stream closed successfully")
             except Exception as e:
                 logger.error(f"Error closing stream: {str(e)}")
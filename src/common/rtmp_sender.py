@@ -17,55 +17,78 @@ class RTMPSender:
     a live audio stream using a pre-recorded audio file.
     """
 
-    def __init__(self, rtmp_url: str, sample_rate: int = 16000):
+    def __init__(self, rtmp_url: str, sample_rate: int = 16000,
+                 realtime: bool = False):
         """
         Initialize the RTMP sender.
 
         Args:
             rtmp_url: URL of the RTMP stream to publish to
             sample_rate: Target sample rate in Hz (default: 16kHz to match STT requirements)
+            realtime: Read the input at its native rate (ffmpeg -re) so the
+                stream is paced like a live source (default: False)
         """
         self.rtmp_url = rtmp_url
         self.sample_rate = sample_rate
+        self.realtime = realtime
         self.process: Optional[ffmpeg.Stream] = None
 
-    def stream_audio_file(self, audio_file: str, loop: bool = False) -> None:
+    def start(self, audio_file: str, loop: bool = False,
+              progress: bool = False) -> None:
         """
-        Stream an audio file to the RTMP server.
+        Start publishing an audio file without waiting for it to finish.
 
         Args:
             audio_file: Path to the audio file to stream
             loop: Whether to loop the audio file continuously (default: False)
+            progress: Write ffmpeg key=value progress reports to the
+                process stdout pipe (default: False)
         """
         if not Path(audio_file).exists():
             raise FileNotFoundError(f"Audio file not found: {audio_file}")
 
+        input_args = {'re': None} if self.realtime else {}
+        output_args = {'progress': 'pipe:1', 'nostats': None} if progress else {}
+
+        # Input configuration
+        input_stream = ffmpeg.input(
+            audio_file,
+            stream_loop=-1 if loop else 0,  # -1 means infinite loop
+            **input_args
+        )
+
+        # Output configuration for RTMP
+        stream = ffmpeg.output(
+            input_stream,
+            self.rtmp_url,
+            format="flv",        # RTMP requires FLV format
+            acodec="aac",        # AAC audio codec
+            ar=self.sample_rate,  # Resample to target rate
+            ac=1,               # Convert to mono
+            ab="64k",           # Lower audio bitrate
+            bufsize="64k",      # Buffer size matching bitrate
+            frame_size=1024,    # Smaller frame size for AAC
+            strict="-2",        # Allow experimental encoders
+            flvflags="no_duration_filesize",  # Skip duration/filesize headers
+            loglevel="warning",
+            **output_args
+        )
+
+        logger.info(f"Starting to stream {audio_file} to {self.rtmp_url}")
+        self.process = stream.run_async(pipe_stdout=progress)
+
+    def stream_audio_file(self, audio_file: str, loop: bool = False) -> None:
+        """
+        Stream an audio file to the RTMP server.
+
+        Args:
+            audio_file: Path to the audio file to stream
+            loop: Whether to loop the audio file continuously (default: False)
+        """
         try:
-            # Input configuration
-            input_stream = ffmpeg.input(
-                audio_file,
-                stream_loop=-1 if loop else 0  # -1 means infinite loop
-            )
-
-            # Output configuration for RTMP
-            stream = ffmpeg.output(
-                input_stream,
-                self.rtmp_url,
-                format="flv",        # RTMP requires FLV format
-                acodec="aac",        # AAC audio codec
-                ar=self.sample_rate,  # Resample to target rate
-                ac=1,               # Convert to mono
-                ab="64k",           # Lower audio bitrate
-                bufsize="64k",      # Buffer size matching bitrate
-                frame_size=1024,    # Smaller frame size for AAC
-                strict="-2",        # Allow experimental encoders
-                flvflags="no_duration_filesize",  # Skip duration/filesize headers
-                loglevel="warning"
-            )
 
             # Start streaming
-            logger.info(f"Starting to stream {audio_file} to {self.rtmp_url}")
-            self.process = stream.run_async(pipe_stdout=False)
+            self.start(audio_file, loop)
 
             # Keep the stream running
             while self.process and self.process.poll() is None:
@@ -95,7 +118,8 @@ class RTMPSender:
 
 
 def stream_file(audio_file: str, rtmp_url: str = "rtmp://localhost/live/test",
-                sample_rate: int = 16000, loop: bool = False) -> None:
+                sample_rate: int = 16000, loop: bool = False,
+                realtime: bool = False) -> None:
     """
     Convenience function to stream an audio file to an RTMP server.
 
@@ -104,8 +128,9 @@ def stream_file(audio_file: str, rtmp_url: str = "rtmp://localhost/live/test",
         rtmp_url: URL of the RTMP server (default: rtmp://localhost/live/test)
         sample_rate: Target sample rate in Hz (default: 16kHz)
         loop: Whether to loop the audio file continuously (default: False)
+        realtime: Pace the stream at the file's native rate (default: False)
     """
-    sender = RTMPSender(rtmp_url, sample_rate)
+    sender = RTMPSender(rtmp_url, sample_rate, realtime)
     try:
         sender.stream_audio_file(audio_file, loop)
     except KeyboardInterrupt:
@@ -133,6 +158,8 @@ if __name__ == "__main__":
                         help="Target sample rate in Hz")
     parser.add_argument("--loop", action="store_true",
                         help="Loop the audio file continuously")
+    parser.add_argument("--realtime", action="store_true",
+                        help="Pace the stream in real time like a live source")
 
     args = parser.parse_args()
 
@@ -141,5 +168,6 @@ if __name__ == "__main__":
         args.audio_file,
         rtmp_url=args.rtmp_url,
         sample_rate=args.sample_rate,
-        loop=args.loop
+        loop=args.loop,
+        realtime=args.realtime
     )
@@ -0,0 +1,3 @@
+from .server import PipelineService, Stage
+
+__all__ = ["PipelineService", "Stage"]
@@ -0,0 +1,350 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from src.common.base_service import BaseService
+from src.stt.registry import create_stt_engine
+from src.stt.server import BaseSTT
+
+logger = logging.getLogger("voxbridge.pipeline")
+
+# Put on a queue after the last item; each stage passes it on and exits
+END = object()
+
+
+class Stage:
+    """
+    One step of the in-process pipeline.
+
+    Takes items from its inbox, runs the blocking handler on the stage's
+    own single-thread executor so engines never run concurrently with
+    themselves, and puts the result (unless None) on its outbox. Because
+    every queue is bounded, a slow stage fills its inbox and the stages
+    before it wait on put(), all the way back to the audio reader.
+    """
+
+    def __init__(self, name: str, handler: Callable[[Any], Any],
+                 inbox: asyncio.Queue, outbox: Optional[asyncio.Queue],
+                 timer: Any):
+        """
+        Initialize the stage.
+
+        Args:
+            name: Stage name used for its thread, timings and stats
+            handler: Blocking function called with each item
+            inbox: Queue the stage consumes
+            outbox: Queue results are put on (None for the last stage)
+            timer: StageTimer that records the handler's duration
+        """
+        self.name = name
+        self.handler = handler
+        self.inbox = inbox
+        self.outbox = outbox
+        self.timer = timer
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"pipeline-{name}")
+        self.processed = 0
+        self.errors = 0
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self.inbox.get()
+            if item is END:
+                break
+            started = time.perf_counter()
+            try:
+                result = await loop.run_in_executor(self.executor, self.handler, item)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Pipeline stage {self.name} failed: {e}", exc_info=True)
+                continue
+            finally:
+                self.timer.record(self.name, time.perf_counter() - started)
+            self.processed += 1
+            if result is not None and self.outbox is not None:
+                await self.outbox.put(result)
+        if self.outbox is not None:
+            await self.outbox.put(END)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.inbox.qsize(),
+            "queue_size": self.inbox.maxsize,
+            "processed": self.processed,
+            "errors": self.errors,
+        }
+
+
+class PlaceholderTranslator:
+    """
+    Stands in for the translation service until it has an engine: returns
+    the source text unchanged for every target language.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        source = config.get("stt", {}).get("language")
+        targets = config.get("translation", {}).get("target_languages", [])
+        self.target_languages = [lang for lang in targets if lang != source]
+
+    def translate(self, text: str) -> Dict[str, Any]:
+        return {
+            "text": text,
+            "translations": {lang: text for lang in self.target_languages},
+        }
+
+
+class PlaceholderTTS:
+    """
+    Stands in for the TTS service until it has an engine: passes the
+    translations through without synthesizing audio.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.voice_profiles = config.get("tts", {}).get("voice_profiles", [])
+
+    def synthesize(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(item, audio={})
+
+
+class LogStreamer:
+    """
+    Stands in for the streaming service until it has an output: logs
+    each translation instead of publishing it.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.logger = logging.getLogger("voxbridge.pipeline.streaming")
+
+    def publish(self, item: Dict[str, Any]) -> None:
+        for lang, text in item["translations"].items():
+            self.logger.info(f"[{lang}] {text}")
+
+
+class PipelineService(BaseService):
+    """
+    Runs reader -> STT -> translation -> TTS -> streaming in one process.
+
+    For small sites this avoids inter-service HTTP, duplicate interpreters
+    and duplicate model and config loading. Stages are connected by
+    bounded asyncio queues (pipeline.queue_size) and run their blocking
+    engines in executors; queue depths are reported in the health check
+    and logged every pipeline.report_interval seconds. The separate
+    services remain the layout for larger sites.
+    """
+
+    # Queues between the stages, named after the stage that consumes them
+    QUEUES = ("stt", "translation", "tts", "streaming")
+
+    def __init__(self, config: Optional[Dict[Any, Any]] = None):
+        super().__init__("pipeline", config)
+        pipeline_config = self.config.get("pipeline", {})
+        self.queue_sizes = {
+            "stt": 2, "translation": 32, "tts": 32, "streaming": 8,
+            **pipeline_config.get("queue_size", {})
+        }
+        self.report_interval = pipeline_config.get("report_interval", 30)
+
+        # The STT engine shares this process' config and stage timings
+        self.stt: BaseSTT = create_stt_engine(self.config, standalone=False)
+        self.stt.stage_timer = self.stage_timer
+        self.stt.transcript_listeners.append(self._on_transcript)
+        # Its logger (also used by engines rebuilt on a hot swap) writes
+        # through this service's queue, off the STT thread
+        self.stt.logger.addHandler(self.log_handler)
+        self.stt.logger.propagate = False
+        self.stt.logger.setLevel(self.logger.level)
+        self.translator = PlaceholderTranslator(self.config)
+        self.tts = PlaceholderTTS(self.config)
+        self.streamer = LogStreamer(self.config)
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.queues: Dict[str, asyncio.Queue] = {}
+        self.stages: List[Stage] = []
+        self.reader_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pipeline-reader")
+
+    def validate_config(self, config: Any) -> None:
+        self.stt.validate_config(config)
+
+    def api_port(self) -> Optional[int]:
+        """Serve on services.pipeline.port, or the STT port the pipeline replaces."""
+        services = self.config.get("services", {})
+        return (services.get("pipeline", {}).get("port")
+                or services.get("stt", {}).get("port"))
+
+    def on_config_change(self, old: Dict[Any, Any], new: Dict[Any, Any]) -> None:
+        self.stt.logger.setLevel(self.logger.level)
+        self.stt.config = new
+        self.stt.on_config_change(old, new)
+
+    def _on_transcript(self, text: str) -> None:
+        """Hand STT output to the translation queue; blocks the STT thread while it is full."""
+        future = asyncio.run_coroutine_threadsafe(
+            self.queues["translation"].put(text), self.loop)
+        while True:
+            try:
+                return future.result(timeout=0.5)
+            except concurrent.futures.TimeoutError:
+                # The stages only stop consuming if the event loop is gone
+                if self.loop.is_closed():
+                    future.cancel()
+                    return
+
+    def _read(self) -> Any:
+        """
+        Read the next chunk on the reader thread.
+
+        Returns:
+            The (chunk, marker) pair for the STT stage, None after a
+            transient error, or END once the stream is over
+        """
+        if not self.stt.connect():
+            return END
+        # Chunks waiting for the STT stage are behind too, so count them
+        # as lag when deciding whether to shed, and drop them first
+        backlog = self.queues["stt"].qsize() * self.stt.chunk_size
+        try:
+            return self.stt.next_chunk(backlog, self._drop_queued_audio)
+        except StopIteration:
+            self.logger.warning("RTMP stream ended")
+            return END
+        except Exception as e:
+            self.logger.error(f"Error reading audio chunk: {str(e)}")
+            return None
+
+    def _drop_queued_audio(self) -> int:
+        """
+        Discard the chunks waiting for the STT stage, from the reader thread.
+
+        Returns:
+            int: Number of chunks dropped
+        """
+        async def drain() -> int:
+            queue = self.queues["stt"]
+            dropped = 0
+            # Only the reader puts on this queue, so END is never in it here
+            while not queue.empty():
+                chunk, _ = queue.get_nowait()
+                dropped += chunk is not None
+            return dropped
+
+        return asyncio.run_coroutine_threadsafe(drain(), self.loop).result()
+
+    async def _read_audio(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self.queues["stt"]
+        while self.running:
+            started = time.perf_counter()
+            item = await loop.run_in_executor(self.reader_executor, self._read)
+            self.stage_timer.record("reader", time.perf_counter() - started)
+            if item is END:
+                break
+            if item is not None:
+                await queue.put(item)
+        self.running = False
+        await queue.put(END)
+
+    async def _report(self) -> None:
+        while True:
+            await asyncio.sleep(self.report_interval)
+            depths = ", ".join(
+                f"{stage.name}={stage.inbox.qsize()}/{stage.inbox.maxsize}"
+                for stage in self.stages)
+            lag = self.stt.reader.lag if self.stt.reader else 0.0
+            self.logger.info(f"Pipeline queue depths: {depths} (reader lag {lag:.2f}s)")
+
+    async def run(self) -> None:
+        """Run all stages until the stream ends or the service is stopped."""
+        self.loop = asyncio.get_running_loop()
+        self.queues = {name: asyncio.Queue(maxsize=self.queue_sizes[name])
+                       for name in self.QUEUES}
+        # The STT stage emits its text through _on_transcript; its outbox
+        # only carries END
+        self.stages = [
+            Stage("stt", lambda item: self.stt.process_chunk(*item),
+                  self.queues["stt"], self.queues["translation"], self.stage_timer),
+            Stage("translation", self.translator.translate,
+                  self.queues["translation"], self.queues["tts"], self.stage_timer),
+            Stage("tts", self.tts.synthesize,
+                  self.queues["tts"], self.queues["streaming"], self.stage_timer),
+            Stage("streaming", self.streamer.publish,
+                  self.queues["streaming"], None, self.stage_timer),
+        ]
+        # Profile the thread doing the transcription, not the event loop
+        self.loop_thread_id = await self.loop.run_in_executor(
+            self.stages[0].executor, threading.get_ident)
+
+        reporter = asyncio.create_task(self._report())
+        try:
+            await asyncio.gather(self._read_audio(), *(stage.run() for stage in self.stages))
+        finally:
+            reporter.cancel()
+
+    def start(self) -> None:
+        self.running = True
+        self.stt.running = True
+        self.logger.info("Starting pipeline service")
+        if not self.stt.rtmp_url:
+            self.logger.warning("No RTMP URL configured, pipeline will not process audio")
+            return
+        self.start_config_watcher()
+        self.start_api()
+        try:
+            self.stt.prepare()
+            asyncio.run(self.run())
+        except Exception as e:
+            self.logger.error(f"Pipeline error: {e}", exc_info=True)
+        finally:
+            self.running = False
+            if self.config_watcher:
+                self.config_watcher.stop()
+                self.config_watcher = None
+            self.stop_api()
+            self.stt.cleanup()
+            self.reader_executor.shutdown(wait=False)
+            for stage in self.stages:
+                stage.executor.shutdown(wait=False)
+            self.stop_logging()
+
+    def _run_service_loop(self) -> None:
+        # The stages run on the event loop started by start()
+        pass
+
+    def cleanup(self) -> None:
+        # Called from the signal handler: let the stages drain and exit;
+        # start() releases the engine and reader once they have
+        self.running = False
+        self.stt.running = False
+
+    def metrics(self) -> Dict[str, float]:
+        # The STT engine's logging stats are this service's
+        metrics = {**self.stt.metrics(), **super().metrics()}
+        for stage in self.stages:
+            stats = stage.stats()
+            metrics.update({
+                f"pipeline_{stage.name}_queue_depth": stats["queue_depth"],
+                f"pipeline_{stage.name}_processed_total": stats["processed"],
+                f"pipeline_{stage.name}_errors_total": stats["errors"],
+            })
+        return metrics
+
+    def health_check(self) -> Dict[str, Any]:
+        stt_health = self.stt.health_check()
+        for key in self.logging_stats():
+            stt_health["details"].pop(key, None)
+        return {
+            "status": "healthy" if self.running and self.stt.ready else "unhealthy",
+            "service": self.service_name,
+            "details": {
+                "running": self.running,
+                "stages": {stage.name: stage.stats() for stage in self.stages},
+                "stt": stt_health["details"],
+                # The STT engine logs through this service's queue
+                **self.logging_stats(),
+            },
+        }
@@ -0,0 +1,6 @@
+"""
+STT engine implementations.
+
+Engines are registered by name in src.stt.registry and imported only when
+selected, so each engine's dependencies are optional.
+"""
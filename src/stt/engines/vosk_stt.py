@@ -0,0 +1,81 @@
+import json
+from typing import Any, Optional
+
+import numpy as np
+
+from src.stt.registry import release_model, shared_model
+from src.stt.server import BaseSTT
+
+
+class VoskSTT(BaseSTT):
+    """
+    On-premise streaming speech recognition with Vosk (Kaldi).
+
+    The model directory is set with stt.model. Vosk recognizes continuously
+    and only returns text once it detects the end of an utterance, so most
+    chunks produce an empty string; small chunk sizes suit it best.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.model_path = self.config.get("stt", {}).get("model")
+        self.model: Optional[Any] = None
+        self.recognizer: Optional[Any] = None
+
+    def load_model(self) -> None:
+        import vosk
+
+        vosk.SetLogLevel(-1)
+        self.model = shared_model(
+            ("vosk", self.model_path), lambda: vosk.Model(self.model_path))
+        self.recognizer = vosk.KaldiRecognizer(self.model, self.sample_rate)
+
+    def warm_up(self) -> None:
+        super().warm_up()
+        # Don't let the synthetic audio leak into the first utterance
+        self.recognizer.Reset()
+
+    def transcribe(self, audio_chunk: np.ndarray) -> str:
+        """
+        Feed an audio chunk to the recognizer.
+
+        Args:
+            audio_chunk: A numpy array containing audio data in PCM format
+
+        Returns:
+            str: The text of an utterance completed by this chunk, or an
+            empty string if the utterance is still in progress
+        """
+        if self.agc_enabled:
+            audio_chunk = self.apply_agc(audio_chunk)
+
+        # Vosk expects 16-bit PCM
+        if audio_chunk.dtype != np.int16:
+            audio_chunk = (np.clip(audio_chunk, -1.0, 1.0) *
+                           np.iinfo(np.int16).max).astype(np.int16)
+
+        if not self.recognizer.AcceptWaveform(audio_chunk.tobytes()):
+            return ""
+
+        text = json.loads(self.recognizer.Result()).get("text", "")
+        return self.apply_dictionary(text)
+
+    def drain(self) -> str:
+        """Return the utterance still in progress and reset the recognizer."""
+        if not self.recognizer:
+            return ""
+        final = json.loads(self.recognizer.FinalResult()).get("text", "")
+        return self.apply_dictionary(final) if final else ""
+
+    def release(self) -> None:
+        self.recognizer = None
+        if self.model:
+            self.model = None
+            release_model(("vosk", self.model_path))
+
+    def cleanup(self) -> None:
+        final = self.drain()
+        if final:
+            self.emit_transcript(final)
+        self.release()
+        super().cleanup()
@@ -0,0 +1,164 @@
+import hashlib
+import os
+from typing import Any, Optional
+
+import numpy as np
+
+from src.stt.registry import release_model, shared_model
+from src.stt.server import BaseSTT
+
+
+def _fp32_checkpoint(checkpoint_file: str, cache_dir: str) -> str:
+    """
+    Return a checkpoint with float32 weights, converting it once if needed.
+
+    The official checkpoints store fp16 weights, which whisper.load_model()
+    copies into the model's float32 parameters. Assigning memory-mapped
+    tensors keeps the file's dtype instead, so the weights are converted
+    once and the float32 copy is cached in cache_dir for every process to
+    map.
+
+    Args:
+        checkpoint_file: Path of the original checkpoint
+        cache_dir: Directory for the converted copy
+
+    Returns:
+        str: Path of a checkpoint whose floating point tensors are float32
+    """
+    import torch
+
+    stat = os.stat(checkpoint_file)
+    key = hashlib.sha256(
+        f"{os.path.abspath(checkpoint_file)}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+    ).hexdigest()[:8]
+    stem = os.path.splitext(os.path.basename(checkpoint_file))[0]
+    converted = os.path.join(cache_dir, f"{stem}-{key}.fp32.pt")
+    if os.path.isfile(converted):
+        return converted
+
+    checkpoint = torch.load(
+        checkpoint_file, map_location="cpu", mmap=True, weights_only=True)
+    state_dict = checkpoint["model_state_dict"]
+    if all(t.dtype == torch.float32 for t in state_dict.values() if t.is_floating_point()):
+        return checkpoint_file
+
+    checkpoint["model_state_dict"] = {
+        name: t.float() if t.is_floating_point() else t
+        for name, t in state_dict.items()
+    }
+    os.makedirs(cache_dir, exist_ok=True)
+    # Written under a temporary name so a concurrent loader never maps a
+    # partial file
+    partial = f"{converted}.{os.getpid()}.tmp"
+    torch.save(checkpoint, partial)
+    os.replace(partial, converted)
+    return converted
+
+
+def load_whisper_mmap(name: str, device: str = "cpu",
+                      download_root: Optional[str] = None) -> Any:
+    """
+    Load a Whisper model with its weights memory-mapped from the checkpoint.
+
+    Mirrors whisper.load_model(), but the checkpoint is opened with
+    torch.load(mmap=True) and the tensors are assigned to the model rather
+    than copied. The model needs float32 weights, so an fp16 checkpoint is
+    converted once to a float32 copy in download_root, which is mapped
+    instead. On CPU the weights then stay backed by that file's pages,
+    which the OS shares between every process that loads the same model.
+
+    Args:
+        name: Official model name (e.g. "small") or path to a checkpoint
+        device: Torch device to run on (default: "cpu")
+        download_root: Where to cache downloaded and converted checkpoints
+
+    Returns:
+        whisper.model.Whisper: The loaded model
+    """
+    import torch
+    import whisper
+    from whisper.model import ModelDimensions, Whisper
+
+    if download_root is None:
+        default = os.path.join(os.path.expanduser("~"), ".cache")
+        download_root = os.path.join(os.getenv("XDG_CACHE_HOME", default), "whisper")
+
+    alignment_heads = None
+    if name in whisper._MODELS:
+        checkpoint_file = whisper._download(whisper._MODELS[name], download_root, False)
+        alignment_heads = whisper._ALIGNMENT_HEADS[name]
+    elif os.path.isfile(name):
+        checkpoint_file = name
+    else:
+        raise RuntimeError(
+            f"Model {name} not found; available models = {whisper.available_models()}")
+
+    checkpoint = torch.load(
+        _fp32_checkpoint(checkpoint_file, download_root),
+        map_location="cpu", mmap=True, weights_only=True)
+    model = Whisper(ModelDimensions(**checkpoint["dims"]))
+    model.load_state_dict(checkpoint["model_state_dict"], assign=True)
+    if alignment_heads is not None:
+        model.set_alignment_heads(alignment_heads)
+    return model.to(device).eval()
+
+
+class WhisperSTT(BaseSTT):
+    """
+    On-premise speech recognition with OpenAI Whisper.
+
+    The model is set with stt.model (a model name or checkpoint path) and
+    the source language with stt.language (None to auto-detect). Whisper
+    decodes whole windows, so it suits larger chunk sizes or overlap mode.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        stt_config = self.config.get("stt", {})
+        self.model_name = stt_config.get("model", "base")
+        self.device = stt_config.get("device", "cpu")
+        self.language = stt_config.get("language")
+        self.model: Optional[Any] = None
+
+    def load_model(self) -> None:
+        self.model = shared_model(
+            ("whisper", self.model_name, self.device),
+            lambda: load_whisper_mmap(self.model_name, self.device))
+
+    def transcribe(self, audio_chunk: np.ndarray) -> str:
+        """
+        Transcribe an audio chunk with Whisper.
+
+        Args:
+            audio_chunk: A numpy array containing audio data in PCM format
+
+        Returns:
+            str: The transcribed text
+        """
+        if self.agc_enabled:
+            audio_chunk = self.apply_agc(audio_chunk)
+
+        # Whisper expects float32 in [-1.0, 1.0] at 16kHz
+        audio = audio_chunk.astype(np.float32)
+        if np.issubdtype(audio_chunk.dtype, np.integer):
+            audio /= np.iinfo(audio_chunk.dtype).max
+
+        result = self.model.transcribe(
+            audio,
+            language=self.language,
+            fp16=self.device != "cpu",
+            # Each window is independent; carrying text over causes loops
+            condition_on_previous_text=False,
+            # Bias decoding towards the custom dictionary
+            initial_prompt=", ".join(self.custom_words) if self.dict_enabled else None
+        )
+        return self.apply_dictionary(result["text"].strip())
+
+    def release(self) -> None:
+        if self.model:
+            self.model = None
+            release_model(("whisper", self.model_name, self.device))
+
+    def cleanup(self) -> None:
+        self.release()
+        super().cleanup()
@@ -0,0 +1,124 @@
+import importlib
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Type, Union
+
+from src.stt.server import BaseSTT, DummySTT
+
+logger = logging.getLogger("voxbridge.stt.registry")
+
+# Engine name (stt.engine) -> "module:Class". Modules are only imported when
+# their engine is selected, so heavy dependencies stay optional.
+ENGINES: Dict[str, Union[str, Type[BaseSTT]]] = {
+    "dummy": DummySTT,
+    "vosk": "src.stt.engines.vosk_stt:VoskSTT",
+    "whisper": "src.stt.engines.whisper_stt:WhisperSTT",
+}
+
+# Model key -> [future of the model, reference count]. The lock only guards
+# the dict; models load outside it so a slow download doesn't block others.
+_models: Dict[Hashable, List[Any]] = {}
+_models_lock = threading.Lock()
+
+
+def register_engine(name: str, engine: Union[str, Type[BaseSTT]]) -> None:
+    """
+    Register an STT engine under a config name.
+
+    Args:
+        name: Value of stt.engine that selects this engine
+        engine: The engine class, or a "module:Class" path imported on first use
+    """
+    ENGINES[name] = engine
+
+
+def get_engine_class(name: str) -> Type[BaseSTT]:
+    """
+    Resolve an engine name to its class, importing its module if needed.
+
+    Raises:
+        KeyError: If no engine is registered under the name
+        ImportError: If the engine or its dependencies cannot be imported
+    """
+    engine = ENGINES[name]
+    if isinstance(engine, str):
+        module_name, _, class_name = engine.partition(":")
+        engine = getattr(importlib.import_module(module_name), class_name)
+        ENGINES[name] = engine
+    return engine
+
+
+def shared_model(key: Hashable, loader: Callable[[], Any]) -> Any:
+    """
+    Load a model once per process and share it between engine instances.
+    Each call takes a reference that must be returned with release_model().
+
+    Args:
+        key: Identifies the model, e.g. (engine name, model path)
+        loader: Called to load the model if it is not cached yet
+
+    Returns:
+        The cached model
+    """
+    with _models_lock:
+        entry = _models.get(key)
+        loading = entry is None
+        if loading:
+            entry = _models[key] = [Future(), 0]
+        entry[1] += 1
+
+    if loading:
+        logger.info(f"Loading model {key}")
+        try:
+            entry[0].set_result(loader())
+        except BaseException as e:
+            with _models_lock:
+                if _models.get(key) is entry:
+                    del _models[key]
+            entry[0].set_exception(e)
+            raise
+    # Other callers wait here for the first one to finish loading
+    return entry[0].result()
+
+
+def release_model(key: Hashable) -> None:
+    """Drop a reference taken by shared_model(); unloads the model at zero."""
+    with _models_lock:
+        entry = _models.get(key)
+        if not entry:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _models[key]
+            logger.info(f"Unloaded model {key}")
+
+
+def create_stt_engine(config: dict, **kwargs: Any) -> BaseSTT:
+    """
+    Create and return the STT engine selected by stt.engine.
+    Falls back to DummySTT if no engine is configured or if it cannot be loaded.
+
+    Args:
+        config: The VoxBridge configuration
+        **kwargs: Additional arguments to pass to the engine (e.g. standalone)
+    """
+    engine_name = config.get("stt", {}).get("engine")
+
+    if not engine_name or engine_name == "placeholder":
+        logger.warning("No STT engine configured, falling back to DummySTT")
+        return DummySTT(config=config, **kwargs)
+
+    try:
+        engine_class = get_engine_class(engine_name)
+    except KeyError:
+        logger.warning(
+            f"Unknown STT engine '{engine_name}' (available: {sorted(ENGINES)}), "
+            "using DummySTT")
+        return DummySTT(config=config, **kwargs)
+    except ImportError as e:
+        logger.error(
+            f"Failed to import STT engine '{engine_name}': {e}, using DummySTT")
+        return DummySTT(config=config, **kwargs)
+
+    return engine_class(config=config, **kwargs)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import yaml
+
+from src.common.capture import ReplayReader
+from src.stt.registry import create_stt_engine
+from src.stt.server import BaseSTT
+
+logger = logging.getLogger("voxbridge.stt.replay")
+
+
+def replay(config: Dict[str, Any], capture: str, speed: float = 0.0,
+           engine: Optional[BaseSTT] = None) -> Dict[str, Any]:
+    """
+    Run a captured stream through an STT engine and report the results.
+
+    The engine processes the capture as it would the live stream, with
+    backpressure and stitching, so a latency spike or mistranscription
+    recorded in production can be reproduced without an RTMP server.
+    Chunks keep their recorded boundaries, so the sizes the adaptive sizer
+    chose during capture are replayed; new resizes are not applied.
+
+    Args:
+        config: The VoxBridge configuration
+        capture: Capture path without extension
+        speed: Playback speed relative to the original arrival times; 0 replays
+            as fast as the engine can process it (default: 0)
+        engine: Engine to use instead of the one selected by stt.engine
+
+    Returns:
+        dict: Transcripts, timing and per-chunk latency statistics
+    """
+    reader = ReplayReader(capture, speed=speed)
+    if engine is None:
+        engine = create_stt_engine(config, standalone=False)
+    if engine.sample_rate != reader.sample_rate:
+        raise ValueError(
+            f"Capture is {reader.sample_rate} Hz but the engine expects "
+            f"{engine.sample_rate} Hz")
+
+    transcripts = []
+    engine.transcript_listeners.append(transcripts.append)
+    engine.prepare()
+    reader.start()
+    engine.attach_reader(reader)
+
+    latencies = []
+    engine.running = True
+    started = time.perf_counter()
+    try:
+        while engine.running:
+            chunk_started = time.perf_counter()
+            engine._run_service_loop()
+            latencies.append(time.perf_counter() - chunk_started)
+    finally:
+        elapsed = time.perf_counter() - started
+        engine.cleanup()
+
+    # The final iteration only detects the end of the capture
+    latencies = np.array(latencies[:-1] or [0.0])
+    return {
+        "capture": str(capture),
+        "engine": engine.engine.__class__.__name__,
+        "speed": speed,
+        "chunks": len(reader.index),
+        "audio_seconds": round(reader.duration, 3),
+        "wall_seconds": round(elapsed, 3),
+        "rtf": round(elapsed / reader.duration, 4) if reader.duration else None,
+        "latency_ms": {
+            "mean": round(float(latencies.mean()) * 1000, 2),
+            "p50": round(float(np.percentile(latencies, 50)) * 1000, 2),
+            "p95": round(float(np.percentile(latencies, 95)) * 1000, 2),
+            "max": round(float(latencies.max()) * 1000, 2),
+        },
+        "transcripts": transcripts,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(
+        description="Replay a captured audio stream through the STT engine")
+    parser.add_argument("capture", help="Capture path without extension")
+    parser.add_argument("--config",
+                        default=f"config/{os.getenv('VOXBRIDGE_ENV', 'development')}.yaml",
+                        help="VoxBridge configuration file")
+    parser.add_argument("--speed", type=float, default=0.0,
+                        help="Playback speed; 1 for the original arrival times, "
+                             "0 for as fast as possible")
+    parser.add_argument("--engine", help="Override stt.engine")
+
+    args = parser.parse_args()
+
+    with open(Path(args.config)) as f:
+        config = yaml.safe_load(f)
+    if args.engine:
+        config.setdefault("stt", {})["engine"] = args.engine
+
+    print(json.dumps(replay(config, args.capture, speed=args.speed), indent=2))
@@ -0,0 +1,252 @@
+import logging
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("voxbridge.stt.scheduler")
+
+
+def rms_db(audio_chunk: np.ndarray) -> float:
+    """Return the RMS level of a PCM chunk in dBFS."""
+    audio_float = audio_chunk.astype(np.float32)
+    if np.issubdtype(audio_chunk.dtype, np.integer):
+        audio_float /= np.iinfo(audio_chunk.dtype).max
+    rms = np.sqrt(np.mean(np.square(audio_float))) if len(audio_float) else 0.0
+    return 20 * np.log10(rms) if rms > 0 else -120.0
+
+
+class LagScheduler:
+    """
+    Keeps transcription close to live audio when the engine falls behind.
+
+    Lag is the amount of decoded audio waiting to be read. Once it exceeds
+    `max_lag` the configured policy sheds load until it drops below
+    `resume_lag`:
+
+    - skip_silence: chunks quieter than `silence_threshold` are not transcribed
+    - merge: buffered chunks are concatenated into one larger batch, up to
+      `max_merge` chunks, so per-call engine overhead is paid less often
+    - drop_oldest: buffered audio is discarded until caught up, and a
+      `drop_marker` caption is emitted in its place
+    """
+
+    POLICIES = ("skip_silence", "merge", "drop_oldest")
+
+    def __init__(self, chunk_size: float, policy: str = "skip_silence",
+                 max_lag: float = 2.0, resume_lag: float = 0.5,
+                 silence_threshold: float = -50.0, max_merge: int = 4,
+                 drop_marker: str = "[…]"):
+        """
+        Initialize the scheduler.
+
+        Args:
+            chunk_size: Duration of one chunk in seconds
+            policy: Shedding policy, one of POLICIES (default: skip_silence)
+            max_lag: Lag in seconds that starts shedding (default: 2.0)
+            resume_lag: Lag in seconds that stops shedding (default: 0.5)
+            silence_threshold: Level in dBFS below which a chunk counts as
+                non-speech for skip_silence (default: -50)
+            max_merge: Maximum chunks per merged batch (default: 4)
+            drop_marker: Caption emitted where audio was dropped
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(
+                f"Unknown backpressure policy '{policy}', expected one of {self.POLICIES}")
+
+        self.chunk_size = chunk_size
+        self.policy = policy
+        self.max_lag = max_lag
+        self.resume_lag = min(resume_lag, max_lag)
+        self.silence_threshold = silence_threshold
+        self.max_merge = max(1, max_merge)
+        self.drop_marker = drop_marker
+
+        self.shedding = False
+        self.lag = 0.0
+        self.peak_lag = 0.0
+        self.chunks_skipped = 0
+        self.chunks_merged = 0
+        self.chunks_dropped = 0
+        self.shed_episodes = 0
+
+    def _update(self, lag: float) -> bool:
+        self.lag = lag
+        self.peak_lag = max(self.peak_lag, lag)
+        if not self.shedding and lag > self.max_lag:
+            self.shedding = True
+            self.shed_episodes += 1
+            logger.warning(
+                f"Transcription lag {lag:.2f}s exceeds {self.max_lag}s, "
+                f"shedding load ({self.policy})")
+        elif self.shedding and lag < self.resume_lag:
+            self.shedding = False
+            logger.info(f"Caught up with live audio (lag {lag:.2f}s)")
+        return self.shedding
+
+    def schedule(self, chunk: np.ndarray, chunks: Iterator[np.ndarray],
+                 lag: Callable[[], float], backlog: float = 0.0,
+                 drop_backlog: Optional[Callable[[], int]] = None
+                 ) -> Tuple[Optional[np.ndarray], Optional[str]]:
+        """
+        Decide what to transcribe for the chunk just read.
+
+        Args:
+            chunk: The chunk just read from the stream
+            chunks: The stream's chunk iterator, for reading ahead
+            lag: Callable returning the audio buffered in the stream, in seconds
+            backlog: Seconds of audio already read but not yet transcribed,
+                e.g. chunks queued for a separate STT thread. It counts
+                towards the lag that starts and stops shedding, but only
+                `lag` decides how far to read ahead, since reading more
+                than the stream has buffered would block on live audio.
+            drop_backlog: Callable discarding the backlog and returning the
+                number of chunks it dropped; drop_oldest calls it before
+                reading ahead, as that audio is the oldest
+
+        Returns:
+            Tuple[Optional[np.ndarray], Optional[str]]: Audio to transcribe
+            (None to skip) and a caption marker to emit first (or None)
+        """
+        buffered = lag()
+        if not self._update(buffered + backlog):
+            return chunk, None
+
+        if self.policy == "skip_silence":
+            if rms_db(chunk) < self.silence_threshold:
+                self.chunks_skipped += 1
+                return None, None
+            return chunk, None
+
+        if self.policy == "merge":
+            # Only merge what is already buffered, so reads don't block
+            extra = min(self.max_merge - 1, int(buffered // self.chunk_size))
+            batch = [chunk] + [next(chunks) for _ in range(extra)]
+            self.chunks_merged += len(batch) - 1
+            return np.concatenate(batch), None
+
+        # drop_oldest: discard the backlog and buffered audio, keep the
+        # newest chunk
+        if drop_backlog is not None:
+            self.chunks_dropped += drop_backlog()
+            backlog = 0.0
+        latest = chunk
+        budget = int(buffered // self.chunk_size) + 1
+        while budget > 0 and lag() > self.resume_lag:
+            latest = next(chunks)
+            self.chunks_dropped += 1
+            budget -= 1
+        self._update(lag() + backlog)
+        return latest, self.drop_marker
+
+    def stats(self) -> Dict[str, Any]:
+        """Return lag and load-shedding counters."""
+        return {
+            "policy": self.policy,
+            "shedding": self.shedding,
+            "lag": round(self.lag, 3),
+            "peak_lag": round(self.peak_lag, 3),
+            "shed_episodes": self.shed_episodes,
+            "chunks_skipped": self.chunks_skipped,
+            "chunks_merged": self.chunks_merged,
+            "chunks_dropped": self.chunks_dropped,
+            "seconds_dropped": round(self.chunks_dropped * self.chunk_size, 3)
+        }
+
+
+class AdaptiveChunkSizer:
+    """
+    Tunes the analysis window to the measured speed of the STT engine.
+
+    Tracks moving averages of transcribe latency and real-time factor
+    (latency / audio duration). The window grows when the engine cannot
+    keep up, since larger windows amortize per-call overhead, and shrinks
+    when the window plus latency exceeds the latency budget or the engine
+    has plenty of headroom, since smaller windows mean lower delay.
+    """
+
+    def __init__(self, chunk_size: float, min_chunk_size: float = 0.25,
+                 max_chunk_size: float = 4.0, latency_budget: float = 2.0,
+                 target_rtf: float = 0.7, step: float = 1.25,
+                 adjust_every: int = 8, smoothing: float = 0.2):
+        """
+        Initialize the chunk sizer.
+
+        Args:
+            chunk_size: Initial window in seconds
+            min_chunk_size: Smallest window in seconds (default: 0.25)
+            max_chunk_size: Largest window in seconds (default: 4.0)
+            latency_budget: Maximum window plus transcribe latency in
+                seconds (default: 2.0)
+            target_rtf: Real-time factor above which the window grows; it
+                shrinks below half of this (default: 0.7)
+            step: Factor the window grows or shrinks by (default: 1.25)
+            adjust_every: Chunks to measure between adjustments (default: 8)
+            smoothing: Weight of the newest sample in the moving averages
+                (default: 0.2)
+        """
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max(min_chunk_size, max_chunk_size)
+        self.chunk_size = min(max(chunk_size, min_chunk_size), self.max_chunk_size)
+        self.latency_budget = latency_budget
+        self.target_rtf = target_rtf
+        self.step = step
+        self.adjust_every = adjust_every
+        self.smoothing = smoothing
+
+        self.avg_latency: Optional[float] = None
+        self.avg_rtf: Optional[float] = None
+        self.adjustments = 0
+        self._since_adjust = 0
+
+    def record(self, latency: float, duration: float) -> Optional[float]:
+        """
+        Record one transcribe call and decide whether to resize the window.
+
+        Args:
+            latency: Seconds the transcribe call took
+            duration: Seconds of audio it transcribed
+
+        Returns:
+            Optional[float]: The new window in seconds, or None to keep it
+        """
+        rtf = latency / duration if duration > 0 else 0.0
+        if self.avg_latency is None:
+            self.avg_latency, self.avg_rtf = latency, rtf
+        else:
+            self.avg_latency += self.smoothing * (latency - self.avg_latency)
+            self.avg_rtf += self.smoothing * (rtf - self.avg_rtf)
+
+        self._since_adjust += 1
+        if self._since_adjust < self.adjust_every:
+            return None
+
+        if self.avg_rtf > self.target_rtf:
+            new_size, reason = self.chunk_size * self.step, "engine slower than real time"
+        elif self.chunk_size + self.avg_latency > self.latency_budget:
+            new_size, reason = self.chunk_size / self.step, "over latency budget"
+        elif self.avg_rtf < self.target_rtf / 2:
+            new_size, reason = self.chunk_size / self.step, "spare engine capacity"
+        else:
+            return None
+
+        new_size = round(min(max(new_size, self.min_chunk_size), self.max_chunk_size), 3)
+        if new_size == self.chunk_size:
+            return None
+
+        logger.info(
+            f"Resizing STT window {self.chunk_size:.3f}s -> {new_size:.3f}s "
+            f"({reason}: avg latency {self.avg_latency:.3f}s, "
+            f"avg RTF {self.avg_rtf:.2f})")
+        self.chunk_size = new_size
+        self.adjustments += 1
+        self._since_adjust = 0
+        return new_size
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current window and latency averages."""
+        return {
+            "chunk_size": self.chunk_size,
+            "avg_latency": round(self.avg_latency or 0.0, 3),
+            "avg_rtf": round(self.avg_rtf or 0.0, 3),
+            "adjustments": self.adjustments
+        }
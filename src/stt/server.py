@@ -1,21 +1,61 @@
-from typing import Any, Dict, Optional, Tuple
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 
 from src.common.base_service import BaseService
-from src.common.rtmp_reader import RTMPReader, create_reader
+from src.common.logging_utils import ThrottledLogger
+from src.common.rtmp_reader import SAMPLE_FORMATS, RTMPReader, create_reader
+from src.stt.scheduler import AdaptiveChunkSizer, LagScheduler
+from src.stt.stitcher import TranscriptStitcher
 
 
 class BaseSTT(BaseService):
-    def __init__(self):
-        super().__init__("stt")
+    # Reading a chunk blocks until the audio arrives, so don't sleep between
+    # iterations; any pause would only add lag
+    loop_interval = 0
+
+    # stt.rtmp keys that need a new reader when they change
+    READER_KEYS = ("url", "sample_format", "filters", "capture")
+    # stt.rtmp keys applied to the service loop at the next chunk boundary
+    LOOP_KEYS = ("chunk_size", "overlap", "adaptive")
+    # stt keys that belong to the service loop rather than the engine
+    SERVICE_KEYS = ("rtmp", "backpressure", "timeout")
+
+    def __init__(self, config: Optional[Dict[Any, Any]] = None,
+                 standalone: bool = True):
+        super().__init__("stt", config, standalone)
         # Get RTMP settings from config
         rtmp_config = self.config.get("stt", {}).get("rtmp", {})
         self.rtmp_url = rtmp_config.get("url")
         self.sample_rate = rtmp_config.get("sample_rate", 16000)
-        self.chunk_size = rtmp_config.get("chunk_size", 0.5)
-
+        self.sample_format = rtmp_config.get("sample_format", "f32le")
+        self.filters = rtmp_config.get("filters", [])
+        # Opt-in recording of the audio read, for replay with ReplayReader
+        self.capture_config = rtmp_config.get("capture", {})
+
+        self.overlap_audio: Optional[np.ndarray] = None
+        self._configure_loop(self.config)
+
+        self.ready = False
+        # The engine that transcribes; replaced on a hot swap
+        self.engine: BaseSTT = self
+        self.swaps = 0
+        self._swap_lock = threading.Lock()
+        self._swap_generation = {"engine": 0, "reader": 0}
+        self._pending_engine: Optional[BaseSTT] = None
+        self._pending_reader: Optional[Tuple[RTMPReader, Iterator[np.ndarray]]] = None
+        self._pending_loop_config: Optional[Dict[Any, Any]] = None
+        self._window_stale = False
+        self.warmup_runs = self.config.get("stt", {}).get("warmup_runs", 2)
         self.reader: Optional[RTMPReader] = None
+        self.chunks: Optional[Iterator[np.ndarray]] = None
+        # Called with every transcript emitted, in addition to logging it
+        self.transcript_listeners: List[Callable[[str], None]] = []
+        # Per-chunk diagnostics are throttled to keep the audio loop cheap
+        self.chunk_logger = ThrottledLogger(self.logger, interval=5.0)
         # Get AGC settings from config
         self.agc_enabled = self.config.get("stt", {}).get(
             "agc", {}).get("enabled", False)
@@ -39,6 +79,50 @@ class BaseSTT(BaseService):
                 len(self.custom_words), self.word_boost, self.case_sensitive
             )
 
+    def _configure_loop(self, config: Dict[Any, Any]) -> None:
+        """Set up chunking, overlap, adaptive sizing and backpressure from config."""
+        rtmp_config = config.get("stt", {}).get("rtmp", {})
+        self.chunk_size = rtmp_config.get("chunk_size", 0.5)
+
+        # With overlap, chunk_size is the hop and each window also includes
+        # the last `overlap` seconds of the previous one
+        self.overlap = rtmp_config.get("overlap", 0.0)
+        self.stitcher: Optional[TranscriptStitcher] = None
+        if self.overlap > 0:
+            self.stitcher = TranscriptStitcher(self.overlap)
+
+        adaptive_config = rtmp_config.get("adaptive", {})
+        self.chunk_sizer: Optional[AdaptiveChunkSizer] = None
+        if adaptive_config.get("enabled", False):
+            self.chunk_sizer = AdaptiveChunkSizer(
+                self.chunk_size,
+                min_chunk_size=adaptive_config.get("min_chunk_size", 0.25),
+                max_chunk_size=adaptive_config.get("max_chunk_size", 4.0),
+                latency_budget=adaptive_config.get("latency_budget", 2.0),
+                target_rtf=adaptive_config.get("target_rtf", 0.7),
+                step=adaptive_config.get("step", 1.25),
+                adjust_every=adaptive_config.get("adjust_every", 8),
+                smoothing=adaptive_config.get("smoothing", 0.2)
+            )
+            self.chunk_size = self.chunk_sizer.chunk_size
+
+        # Get backpressure settings from config
+        bp_config = config.get("stt", {}).get("backpressure", {})
+        self.scheduler: Optional[LagScheduler] = None
+        if bp_config.get("enabled", False):
+            self.scheduler = LagScheduler(
+                self.chunk_size,
+                policy=bp_config.get("policy", "skip_silence"),
+                max_lag=bp_config.get("max_lag", 2.0),
+                resume_lag=bp_config.get("resume_lag", 0.5),
+                silence_threshold=bp_config.get("silence_threshold", -50),
+                max_merge=bp_config.get("max_merge", 4),
+                drop_marker=bp_config.get("drop_marker", "[…]")
+            )
+            self.logger.info(
+                "Backpressure enabled (policy: %s, max_lag: %.1fs)",
+                self.scheduler.policy, self.scheduler.max_lag)
+
     def apply_agc(self, audio_chunk: np.ndarray) -> np.ndarray:
         """
         Apply Automatic Gain Control to the audio chunk.
@@ -52,8 +136,10 @@ class BaseSTT(BaseService):
         if not self.agc_enabled:
             return audio_chunk
 
-        # Convert to float32 for processing
-        audio_float = audio_chunk.astype(np.float32)
+        # Convert to float32 in [-1.0, 1.0] for processing
+        is_int = np.issubdtype(audio_chunk.dtype, np.integer)
+        scale = np.iinfo(audio_chunk.dtype).max if is_int else 1.0
+        audio_float = audio_chunk.astype(np.float32) / scale
 
         # Calculate current RMS level in dB
         rms = np.sqrt(np.mean(np.square(audio_float)))
@@ -70,13 +156,264 @@ class BaseSTT(BaseService):
         # Clip to prevent overflow
         audio_adjusted = np.clip(audio_adjusted, -1.0, 1.0)
 
-        self.logger.debug(
+        self.chunk_logger.debug(
             "AGC: current_level=%.2f dB, applied_gain=%.2f dB",
             current_level, required_gain
         )
 
         # Convert back to original dtype
-        return (audio_adjusted * np.iinfo(audio_chunk.dtype).max).astype(audio_chunk.dtype)
+        return (audio_adjusted * scale).astype(audio_chunk.dtype)
+
+    def load_model(self) -> None:
+        """
+        Load the engine's model and other heavy resources.
+
+        Called once before warm-up. Engines should import their dependencies
+        here rather than at module level, and load weights through
+        registry.shared_model() so instances in one process share a copy.
+        """
+        pass
+
+    def warm_up(self) -> None:
+        """
+        Run the engine on synthetic audio so the first real chunk doesn't pay
+        for JIT compilation, lazy initialization or allocator growth.
+        """
+        dtype = SAMPLE_FORMATS[self.sample_format][1]
+        samples = int((self.chunk_size + self.overlap) * self.sample_rate)
+        # Low-level noise rather than silence, so engines run their full path
+        noise = np.random.default_rng(0).normal(0, 0.01, samples)
+        if np.issubdtype(dtype, np.integer):
+            noise *= np.iinfo(dtype).max
+        audio = noise.astype(dtype)
+
+        started = time.perf_counter()
+        for _ in range(self.warmup_runs):
+            self.transcribe(audio)
+        self.logger.info(
+            "Warm-up finished: %d runs in %.2fs",
+            self.warmup_runs, time.perf_counter() - started)
+
+    def prepare(self) -> None:
+        """Load the model and warm up; the service reports healthy afterwards."""
+        if self.ready:
+            return
+        started = time.perf_counter()
+        self.load_model()
+        self.warm_up()
+        self.ready = True
+        self.logger.info(
+            "%s ready in %.2fs", self.__class__.__name__, time.perf_counter() - started)
+
+    def drain(self) -> str:
+        """
+        Finish in-flight work before the engine is swapped out.
+
+        Returns:
+            str: Any text the engine was still holding, e.g. a partial utterance
+        """
+        return ""
+
+    def release(self) -> None:
+        """Free the engine's resources after it has been swapped out."""
+        pass
+
+    def validate_config(self, config: Any) -> None:
+        super().validate_config(config)
+        # Imported here because the registry imports this module
+        from src.stt.registry import ENGINES
+
+        stt_config = config.get("stt", {})
+        engine = stt_config.get("engine")
+        if engine and engine != "placeholder" and engine not in ENGINES:
+            raise ValueError(
+                f"Unknown STT engine '{engine}' (available: {sorted(ENGINES)})")
+        policy = stt_config.get("backpressure", {}).get("policy")
+        if policy and policy not in LagScheduler.POLICIES:
+            raise ValueError(f"Unknown backpressure policy '{policy}'")
+        sample_format = stt_config.get("rtmp", {}).get("sample_format")
+        if sample_format and sample_format not in SAMPLE_FORMATS:
+            raise ValueError(f"Unsupported sample format '{sample_format}'")
+
+    def on_config_change(self, old: Dict[Any, Any], new: Dict[Any, Any]) -> None:
+        """
+        Rebuild the engine or reader in the background if their settings
+        changed, and apply new chunking and backpressure settings at the
+        next chunk boundary.
+        """
+        old_stt, new_stt = old.get("stt", {}), new.get("stt", {})
+
+        def engine_settings(stt_config: Dict[str, Any]) -> Dict[str, Any]:
+            return {k: v for k, v in stt_config.items() if k not in self.SERVICE_KEYS}
+
+        if engine_settings(old_stt) != engine_settings(new_stt):
+            self._start_swap("engine", self._build_engine, new)
+
+        old_rtmp, new_rtmp = old_stt.get("rtmp", {}), new_stt.get("rtmp", {})
+        if any(old_rtmp.get(k) != new_rtmp.get(k) for k in self.READER_KEYS):
+            self._start_swap("reader", self._build_reader, new_rtmp)
+
+        if any(old_rtmp.get(k) != new_rtmp.get(k) for k in self.LOOP_KEYS) or \
+                old_stt.get("backpressure") != new_stt.get("backpressure"):
+            self.logger.info("Chunking or backpressure settings changed, "
+                             "applying at the next chunk")
+            with self._swap_lock:
+                self._pending_loop_config = new
+
+        if old_rtmp.get("sample_rate") != new_rtmp.get("sample_rate"):
+            self.logger.warning(
+                "stt.rtmp.sample_rate changes need a restart; still using "
+                f"{self.sample_rate} Hz")
+
+    def _start_swap(self, kind: str, build: Any, settings: Dict[str, Any]) -> None:
+        with self._swap_lock:
+            self._swap_generation[kind] += 1
+            generation = self._swap_generation[kind]
+        self.logger.info(f"Building replacement {kind} in the background")
+        threading.Thread(
+            target=build, args=(settings, generation),
+            name=f"stt-{kind}-swap", daemon=True).start()
+
+    def _build_engine(self, config: Dict[Any, Any], generation: int) -> None:
+        # Imported here because the registry imports this module
+        from src.stt.registry import create_stt_engine
+
+        try:
+            engine = create_stt_engine(config, standalone=False)
+            engine.prepare()
+        except Exception as e:
+            self.logger.error(
+                f"Failed to build replacement STT engine, keeping "
+                f"{self.engine.__class__.__name__}: {e}", exc_info=True)
+            return
+
+        with self._swap_lock:
+            if generation != self._swap_generation["engine"]:
+                # A newer change superseded this one while it was loading
+                engine.release()
+                return
+            if self._pending_engine:
+                self._pending_engine.release()
+            self._pending_engine = engine
+
+    def _capture_options(self, capture_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Reader arguments that record the stream when capture is enabled."""
+        if not capture_config.get("enabled", False):
+            return {}
+        capture_dir = capture_config.get("dir", "/tmp/voxbridge/capture")
+        max_mb = capture_config.get("max_mb", 500)
+        return {
+            "capture": f"{capture_dir}/{self.service_name}-{time.strftime('%Y%m%d-%H%M%S')}",
+            "capture_max_bytes": int(max_mb * 1024 * 1024) if max_mb else None,
+        }
+
+    def attach_reader(self, reader: Any,
+                      chunks: Optional[Iterator[np.ndarray]] = None) -> None:
+        """
+        Read audio from an already started reader, e.g. a ReplayReader,
+        instead of connecting to stt.rtmp.url.
+
+        Args:
+            reader: An RTMPReader or anything with the same interface
+            chunks: Iterator over the reader's chunks, if already created
+        """
+        # The window is reset by the thread that transcribes, before the
+        # first chunk from the new reader
+        self._window_stale = True
+        self.reader = reader
+        self.chunks = chunks if chunks is not None else reader.read_chunks()
+        self.rtmp_url = reader.rtmp_url
+        self.sample_format = reader.sample_format
+        self.filters = reader.filters
+
+    def _build_reader(self, rtmp_config: Dict[str, Any], generation: int) -> None:
+        try:
+            reader = create_reader(
+                rtmp_config.get("url"),
+                sample_rate=self.sample_rate,
+                chunk_size=self.chunk_size,
+                sample_format=rtmp_config.get("sample_format", "f32le"),
+                filters=rtmp_config.get("filters", []),
+                **self._capture_options(rtmp_config.get("capture", {}))
+            )
+            # Wait for audio to flow before offering the reader for the swap
+            chunks = reader.read_chunks()
+            chunks = itertools.chain([next(chunks)], chunks)
+        except Exception as e:
+            self.logger.error(
+                f"Failed to connect replacement RTMP reader, keeping current: {e}")
+            return
+
+        with self._swap_lock:
+            if generation != self._swap_generation["reader"]:
+                reader.stop()
+                return
+            if self._pending_reader:
+                self._pending_reader[0].stop()
+            self._pending_reader = (reader, chunks)
+            self.capture_config = rtmp_config.get("capture", {})
+
+    def _swap_engine(self) -> None:
+        """Switch to an engine built in the background; runs between chunks."""
+        with self._swap_lock:
+            engine, self._pending_engine = self._pending_engine, None
+        if not engine:
+            return
+
+        started = time.perf_counter()
+        old, self.engine = self.engine, engine
+        text = old.drain()
+        if text:
+            self.emit_transcript(text)
+        # Also when the original engine is swapped out: this instance keeps
+        # running the loop but its own transcribe() is no longer used
+        old.release()
+        self.swaps += 1
+        self.logger.info(
+            "Switched STT engine %s -> %s in %.1f ms",
+            old.__class__.__name__, engine.__class__.__name__,
+            (time.perf_counter() - started) * 1000)
+
+    def _apply_loop_config(self) -> None:
+        """Rebuild chunking and backpressure after a config change; runs between chunks."""
+        with self._swap_lock:
+            config, self._pending_loop_config = self._pending_loop_config, None
+        if not config:
+            return
+
+        self._reset_window()
+        self._configure_loop(config)
+        if self.reader:
+            self.reader.set_chunk_size(self.chunk_size)
+        self.logger.info(
+            "Applied chunk size %.2fs, overlap %.2fs, adaptive %s, backpressure %s",
+            self.chunk_size, self.overlap, self.chunk_sizer is not None,
+            self.scheduler.policy if self.scheduler else "off")
+
+    def _swap_reader(self) -> None:
+        """Switch to a reader connected in the background; runs between reads."""
+        with self._swap_lock:
+            pending_reader, self._pending_reader = self._pending_reader, None
+        if not pending_reader:
+            return
+
+        old_reader = self.reader
+        self.attach_reader(*pending_reader)
+        self.swaps += 1
+        self.logger.info(f"Switched RTMP reader to {self.rtmp_url}")
+        if old_reader:
+            # Stopping waits for ffmpeg to exit; keep that off the audio path
+            threading.Thread(target=old_reader.stop, daemon=True).start()
+
+    def start(self) -> None:
+        try:
+            self.prepare()
+        except Exception as e:
+            self.logger.error(f"Failed to prepare STT engine: {e}", exc_info=True)
+            self.cleanup()
+            self.stop_logging()
+            return
+        super().start()
 
     def transcribe(self, audio_chunk: np.ndarray) -> str:
         """
@@ -102,21 +439,110 @@ class BaseSTT(BaseService):
             self.logger.info("Stopping RTMP reader")
             self.reader.stop()
             self.reader = None
+            self.chunks = None
+        self._reset_window()
+        with self._swap_lock:
+            if self._pending_engine:
+                self._pending_engine.release()
+                self._pending_engine = None
+            if self._pending_reader:
+                self._pending_reader[0].stop()
+                self._pending_reader = None
+        if self.engine is not self:
+            self.engine.release()
+            self.engine = self
         self.logger.info("Cleaning up STT service")
 
     def health_check(self) -> Dict[str, Any]:
         """Check the health of the STT service"""
         return {
-            "status": "healthy" if self.running else "unhealthy",
+            "status": "healthy" if self.running and self.ready else "unhealthy",
             "service": self.service_name,
             "details": {
                 "running": self.running,
+                "ready": self.ready,
+                "engine": self.engine.__class__.__name__,
+                "swaps": self.swaps,
                 "agc_enabled": self.agc_enabled,
                 "dictionary_enabled": self.dict_enabled,
-                "dictionary_words": len(self.custom_words) if self.dict_enabled else 0
+                "dictionary_words": len(self.custom_words) if self.dict_enabled else 0,
+                "chunk_size": self.chunk_size,
+                "overlap": self.overlap,
+                "adaptive_chunking": self.chunk_sizer.stats() if self.chunk_sizer else None,
+                "lag": round(self.reader.lag, 3) if self.reader else 0.0,
+                "backpressure": self.scheduler.stats() if self.scheduler else None,
+                **self.logging_stats()
             }
         }
 
+    def metrics(self) -> Dict[str, float]:
+        """Window size, lag and load-shedding counters for /metrics."""
+        metrics = {
+            **super().metrics(),
+            "stt_chunk_size_seconds": self.chunk_size,
+            "stt_lag_seconds": self.reader.lag if self.reader else 0.0,
+            "stt_engine_swaps_total": self.swaps,
+        }
+        if self.scheduler:
+            stats = self.scheduler.stats()
+            metrics.update({
+                "stt_peak_lag_seconds": stats["peak_lag"],
+                "stt_shedding": int(stats["shedding"]),
+                "stt_shed_episodes_total": stats["shed_episodes"],
+                "stt_chunks_skipped_total": stats["chunks_skipped"],
+                "stt_chunks_merged_total": stats["chunks_merged"],
+                "stt_chunks_dropped_total": stats["chunks_dropped"],
+                "stt_dropped_seconds_total": stats["seconds_dropped"],
+            })
+        if self.chunk_sizer:
+            stats = self.chunk_sizer.stats()
+            metrics.update({
+                "stt_transcribe_latency_seconds": stats["avg_latency"],
+                "stt_realtime_factor": stats["avg_rtf"],
+                "stt_chunk_size_adjustments_total": stats["adjustments"],
+            })
+        return metrics
+
+    def _build_window(self, chunk: np.ndarray) -> np.ndarray:
+        """Prepend the overlap kept from the previous window to a chunk."""
+        if not self.stitcher:
+            return chunk
+        if self.overlap_audio is not None:
+            window = np.concatenate((self.overlap_audio, chunk))
+        else:
+            window = chunk
+        self.overlap_audio = window[-int(self.overlap * self.sample_rate):]
+        return window
+
+    def _reset_window(self) -> None:
+        """Break the window chain at a gap in the audio."""
+        self.overlap_audio = None
+        if self.stitcher:
+            text = self.stitcher.flush()
+            if text:
+                self.emit_transcript(text)
+
+    def _adapt_chunk_size(self, latency: float, duration: float) -> None:
+        new_size = self.chunk_sizer.record(latency, duration)
+        if new_size is None:
+            return
+        self.chunk_size = new_size
+        if self.reader:
+            self.reader.set_chunk_size(new_size)
+        if self.scheduler:
+            self.scheduler.chunk_size = new_size
+
+    def emit_transcript(self, text: str) -> None:
+        """
+        Hand a transcription result to downstream consumers.
+
+        Args:
+            text: Transcribed text, or a marker such as "[…]" for dropped audio
+        """
+        self.chunk_logger.debug("Transcribed text: %s", text)
+        for listener in self.transcript_listeners:
+            listener(text)
+
     def get_dictionary_words(self) -> list[str]:
         """
         Get the list of custom dictionary words.
@@ -157,6 +583,100 @@ class BaseSTT(BaseService):
 
         return result
 
+    def next_chunk(self, backlog: float = 0.0,
+                   drop_backlog: Optional[Callable[[], int]] = None
+                   ) -> Tuple[Optional[np.ndarray], Optional[str]]:
+        """
+        Read the next chunk from the reader and apply backpressure.
+
+        Args:
+            backlog: Seconds of audio already read but not yet transcribed,
+                e.g. chunks queued for a separate STT thread; counted as lag
+                when deciding whether to shed
+            drop_backlog: Callable discarding that backlog and returning the
+                number of chunks dropped, for the drop_oldest policy
+
+        Returns:
+            Tuple: The chunk to transcribe (None if it was shed) and a marker
+            to emit for audio dropped before it (None if nothing was dropped)
+
+        Raises:
+            StopIteration: When the stream has ended
+        """
+        stage = self.stage_timer.stage
+        with stage("read"):
+            chunk = next(self.chunks)
+        marker = None
+        if self.scheduler:
+            with stage("schedule"):
+                chunk, marker = self.scheduler.schedule(
+                    chunk, self.chunks, lambda: self.reader.lag,
+                    backlog, drop_backlog)
+        return chunk, marker
+
+    def process_chunk(self, chunk: Optional[np.ndarray],
+                      marker: Optional[str] = None) -> None:
+        """
+        Transcribe a chunk returned by next_chunk() and emit the result.
+
+        Args:
+            chunk: Audio to transcribe, or None if it was shed
+            marker: Marker for dropped audio, emitted before the chunk's text
+        """
+        # Chunk boundary: switch to an engine rebuilt after a config change
+        self._swap_engine()
+        self._apply_loop_config()
+        if self._window_stale:
+            self._window_stale = False
+            self._reset_window()
+        if marker:
+            self._reset_window()
+            self.emit_transcript(marker)
+        if chunk is None:
+            self._reset_window()
+            return
+        window = self._build_window(chunk)
+        started = time.perf_counter()
+        text = self.engine.transcribe(window)
+        latency = time.perf_counter() - started
+        self.stage_timer.record("transcribe", latency)
+        if self.chunk_sizer:
+            # The engine has one hop of real time to process each window
+            self._adapt_chunk_size(latency, len(chunk) / self.sample_rate)
+        if self.stitcher:
+            with self.stage_timer.stage("stitch"):
+                text = self.stitcher.push(text, len(window) / self.sample_rate)
+        if text:
+            with self.stage_timer.stage("emit"):
+                self.emit_transcript(text)
+
+    def connect(self) -> bool:
+        """
+        Start the RTMP reader if there is none. Called before each read.
+
+        Returns:
+            bool: True if a reader is ready to read from
+        """
+        # Switch to a reader reconnected after a config change
+        self._swap_reader()
+        if self.reader:
+            return True
+        try:
+            self.reader = create_reader(
+                self.rtmp_url,
+                sample_rate=self.sample_rate,
+                chunk_size=self.chunk_size,
+                sample_format=self.sample_format,
+                filters=self.filters,
+                **self._capture_options(self.capture_config)
+            )
+            self.chunks = self.reader.read_chunks()
+            self.logger.info("Started RTMP reader")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to start RTMP reader: {str(e)}")
+            return False
+
     def _run_service_loop(self) -> None:
         """Process audio chunks from RTMP stream"""
         if not self.rtmp_url:
@@ -165,24 +685,14 @@ class BaseSTT(BaseService):
             self.running = False
             return
 
-        if not self.reader:
-            try:
-                self.reader = create_reader(
-                    self.rtmp_url,
-                    sample_rate=self.sample_rate,
-                    chunk_size=self.chunk_size
-                )
-                self.logger.info("Started RTMP reader")
-            except Exception as e:
-                self.logger.error(f"Failed to start RTMP reader: {str(e)}")
-                self.running = False
-                return
+        if not self.connect():
+            self.running = False
+            return
 
         try:
             # Process one chunk per loop iteration
-            chunk = next(self.reader.read_chunks())
-            text = self.transcribe(chunk)
-            self.logger.info(f"Transcribed text: {text}")
+            chunk, marker = self.next_chunk()
+            self.process_chunk(chunk, marker)
         except StopIteration:
             self.logger.warning("RTMP stream ended")
             self.running = False
@@ -210,7 +720,7 @@ class DummySTT(BaseSTT):
         if self.agc_enabled:
             audio_chunk = self.apply_agc(audio_chunk)
 
-        self.logger.debug(
+        self.chunk_logger.debug(
             "DummySTT received audio chunk of shape: %s", audio_chunk.shape)
 
         # Return a test string that includes some dictionary words in wrong case
@@ -219,6 +729,7 @@ class DummySTT(BaseSTT):
         # Apply dictionary-based corrections if enabled
         if self.dict_enabled:
             test_text = self.apply_dictionary(test_text)
-            self.logger.debug("Applied dictionary corrections: %s", test_text)
+            self.chunk_logger.debug(
+                "Applied dictionary corrections: %s", test_text)
 
         return test_text
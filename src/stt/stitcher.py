@@ -0,0 +1,130 @@
+import logging
+import re
+from difflib import SequenceMatcher
+from typing import List
+
+logger = logging.getLogger("voxbridge.stt.stitcher")
+
+
+def _normalize(word: str) -> str:
+    return re.sub(r"[^\w]", "", word.lower())
+
+
+def _similar(a: str, b: str) -> bool:
+    """
+    Whether two normalized words are likely the same speech. A word cut
+    at a window edge is often recognized as a fragment ("shep", "herd") or
+    a near miss ("shepard") of what the other window hears ("shepherd").
+    """
+    if a == b:
+        return True
+    shorter, longer = sorted((a, b), key=len)
+    if len(shorter) >= 3 and (longer.startswith(shorter) or longer.endswith(shorter)):
+        return True
+    return len(shorter) >= 5 and SequenceMatcher(None, a, b).ratio() >= 0.8
+
+
+class TranscriptStitcher:
+    """
+    Merges hypotheses from overlapping windows into a stream of new words.
+
+    Consecutive windows share `overlap` seconds of audio, so the tail of one
+    hypothesis and the head of the next describe the same speech. Words
+    estimated to fall in a window's trailing overlap are held back as
+    pending. When the next hypothesis arrives, words already emitted are
+    stripped from its head and the pending words are aligned against it:
+    the longest run of pending words that the new head repeats, allowing
+    for a word misheard where a window cut it, is taken from the new
+    hypothesis, and pending words before that run lay outside the real
+    overlap, so they are confirmed as they were. Only words that
+    are new and stable are returned, so downstream stages never see
+    duplicates or lose words.
+    """
+
+    def __init__(self, overlap: float, max_ngram: int = 6):
+        """
+        Initialize the stitcher.
+
+        Args:
+            overlap: Seconds of audio shared by consecutive windows
+            max_ngram: Longest run of already-emitted words to look for at
+                the head of a new hypothesis (default: 6)
+        """
+        self.overlap = overlap
+        self.max_ngram = max_ngram
+        self.pending: List[str] = []
+        self.committed: List[str] = []
+
+    def _emitted_prefix(self, words: List[str]) -> int:
+        """Length of the longest head of `words` that repeats the committed tail."""
+        tail = [_normalize(w) for w in self.committed[-self.max_ngram:]]
+        head = [_normalize(w) for w in words[:self.max_ngram]]
+        for n in range(min(len(tail), len(head)), 0, -1):
+            if tail[-n:] == head[:n]:
+                return n
+        return 0
+
+    def _pending_overlap(self, words: List[str]) -> int:
+        """
+        Length of the longest tail of the pending words that starts `words`.
+        The last pending word and the first new word may have been cut by
+        a window edge, so those only need to be similar.
+        """
+        pending = [_normalize(w) for w in self.pending]
+        head = [_normalize(w) for w in words[:len(pending)]]
+        for n in range(min(len(pending), len(head)), 0, -1):
+            pairs = list(zip(pending[-n:], head[:n]))
+            if all(_similar(a, b) if i in (0, n - 1) else a == b
+                   for i, (a, b) in enumerate(pairs)):
+                return n
+        return 0
+
+    def _commit(self, words: List[str]) -> str:
+        self.committed = (self.committed + words)[-self.max_ngram:]
+        return " ".join(words)
+
+    def push(self, text: str, window_duration: float) -> str:
+        """
+        Add the hypothesis for the next window.
+
+        Args:
+            text: Transcription of the whole window, overlap included
+            window_duration: Length of the window in seconds
+
+        Returns:
+            str: Newly stable words, or an empty string if there are none
+        """
+        words = text.split()
+        if not words:
+            # Nothing recognized in the overlap either, so the held-back
+            # words will never be confirmed
+            return self.flush()
+
+        # Words estimated to lie in the trailing overlap are held back
+        hold = round(len(words) * self.overlap / window_duration) \
+            if window_duration > 0 else 0
+
+        words = words[self._emitted_prefix(words):]
+
+        # The hold is only an estimate, so pending words may lie before the
+        # real overlap and not be repeated; those are confirmed as they are
+        agreed = self._pending_overlap(words)
+        before_overlap = self.pending[:len(self.pending) - agreed]
+        if before_overlap:
+            logger.debug(
+                "Confirming held-back words %s not repeated by the next window",
+                before_overlap)
+
+        stable_end = max(agreed, len(words) - hold)
+        self.pending = words[stable_end:]
+        return self._commit(before_overlap + words[:stable_end])
+
+    def flush(self) -> str:
+        """
+        Emit the held-back words, e.g. at a gap in the audio or end of stream.
+
+        Returns:
+            str: The pending words, or an empty string
+        """
+        pending, self.pending = self.pending, []
+        return self._commit(pending)
@@ -0,0 +1,82 @@
+import subprocess
+import sys
+import time
+import types
+
+from src.common.rtmp_reader import RTMPReader
+
+SAMPLE_RATE = 16000
+CHUNK_SIZE = 0.05
+
+
+class RealTimeSource:
+    """A decoder pipe producing audio in real time, with an optional stall."""
+
+    def __init__(self, stall_at=None, stall=0.0, itemsize=4):
+        self.bytes_per_second = SAMPLE_RATE * itemsize
+        self.stall_at = stall_at
+        self.stall = stall
+        self.start = time.monotonic()
+        self.position = 0
+
+    def read(self, size):
+        end = self.position + size
+        available_at = end / self.bytes_per_second
+        if self.stall_at is not None and available_at > self.stall_at:
+            available_at += self.stall
+        delay = self.start + available_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.position = end
+        return bytes(size)
+
+
+def make_reader(source):
+    reader = RTMPReader("rtmp://test", sample_rate=SAMPLE_RATE, chunk_size=CHUNK_SIZE)
+    reader.process = types.SimpleNamespace(stdout=source)
+    return reader
+
+
+def test_source_stall_is_not_reported_as_lag():
+    reader = make_reader(RealTimeSource(stall_at=0.3, stall=0.5))
+    chunks = reader.read_chunks()
+
+    lags = []
+    for _ in range(int(1.0 / CHUNK_SIZE)):
+        next(chunks)
+        lags.append(reader.lag)
+
+    # The consumer keeps up, so after the stall nothing is queued
+    assert max(lags[-5:]) < CHUNK_SIZE
+
+
+def test_slow_consumer_lag_grows():
+    reader = make_reader(RealTimeSource())
+    chunks = reader.read_chunks()
+
+    next(chunks)
+    for _ in range(10):
+        # Take twice as long as real time to process each chunk
+        time.sleep(2 * CHUNK_SIZE)
+        next(chunks)
+
+    assert reader.lag > 5 * CHUNK_SIZE
+
+
+def test_lag_is_zero_before_first_chunk():
+    reader = make_reader(RealTimeSource())
+    assert reader.lag == 0.0
+    assert reader.samples_read == 0
+
+
+def test_stop_ends_the_decoder_process():
+    reader = RTMPReader("rtmp://test", sample_rate=SAMPLE_RATE, chunk_size=CHUNK_SIZE)
+    # Like ffmpeg.run_async(pipe_stdout=True): stdin is not piped
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(60)"], stdout=subprocess.PIPE)
+    reader.process = process
+
+    reader.stop()
+
+    assert process.poll() is not None
+    assert reader.process is None
@@ -0,0 +1,56 @@
+import numpy as np
+
+from src.stt.scheduler import LagScheduler
+
+CHUNK_SIZE = 0.5
+
+
+class BufferedStream:
+    """A stream with some chunks already buffered; reading past them would block."""
+
+    def __init__(self, buffered):
+        self.buffered = buffered
+        self.blocked = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.buffered:
+            self.buffered -= 1
+        else:
+            self.blocked += 1
+        return np.ones(8000, dtype=np.float32)
+
+    def lag(self):
+        return self.buffered * CHUNK_SIZE
+
+
+def test_drop_oldest_drops_backlog_without_blocking():
+    scheduler = LagScheduler(CHUNK_SIZE, policy="drop_oldest", max_lag=2.0, resume_lag=0.5)
+    stream = BufferedStream(buffered=4)
+    queued = [object(), object()]
+
+    def drop_backlog():
+        dropped = len(queued)
+        queued.clear()
+        return dropped
+
+    chunk, marker = scheduler.schedule(
+        next(stream), stream, stream.lag, backlog=1.0, drop_backlog=drop_backlog)
+
+    assert marker == scheduler.drop_marker
+    assert chunk is not None
+    assert not queued
+    assert stream.blocked == 0
+    assert scheduler.chunks_dropped == 2 + 2
+
+
+def test_backlog_alone_does_not_read_ahead():
+    for policy in ("merge", "drop_oldest"):
+        scheduler = LagScheduler(CHUNK_SIZE, policy=policy, max_lag=2.0, resume_lag=0.5)
+        stream = BufferedStream(buffered=0)
+        chunk, _ = scheduler.schedule(np.ones(8000, dtype=np.float32), stream,
+                                      stream.lag, backlog=3.0)
+        assert stream.blocked == 0
+        assert len(chunk) == 8000
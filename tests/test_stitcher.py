@@ -0,0 +1,58 @@
+import pytest
+
+from src.stt.stitcher import TranscriptStitcher
+
+
+def stitch(stitcher, hypotheses):
+    out = []
+    for text, duration in hypotheses:
+        out.extend(stitcher.push(text, duration).split())
+    out.extend(stitcher.flush().split())
+    return out
+
+
+def windows(words_per_second, hop, overlap, duration):
+    """Hypotheses of a perfect recognizer over overlapping windows."""
+    count = int(duration * words_per_second)
+    times = [i / words_per_second for i in range(count)]
+    words = [f"w{i}" for i in range(count)]
+    hypotheses = []
+    start = 0.0
+    while start < duration:
+        window_start = max(0.0, start - overlap)
+        end = start + hop
+        text = " ".join(w for w, t in zip(words, times) if window_start <= t < end)
+        hypotheses.append((text, end - window_start))
+        start = end
+    return words, hypotheses
+
+
+def test_pending_words_before_the_overlap_are_kept():
+    stitcher = TranscriptStitcher(overlap=0.5)
+    assert stitch(stitcher, [("d e", 1.5), ("f g", 1.5)]) == ["d", "e", "f", "g"]
+
+
+@pytest.mark.parametrize("words_per_second, hop, overlap", [
+    (1.5, 1.0, 0.5),
+    (1.5, 3.0, 1.0),
+    (2.5, 2.0, 0.5),
+    (3.0, 0.5, 0.25),
+])
+def test_no_words_lost_or_duplicated(words_per_second, hop, overlap):
+    words, hypotheses = windows(words_per_second, hop, overlap, duration=60)
+    stitcher = TranscriptStitcher(overlap=overlap)
+    assert stitch(stitcher, hypotheses) == words
+
+
+
+@pytest.mark.parametrize("first, second", [
+    ("the lord is my shep", "shepherd I shall not"),
+    ("the lord is my shepard", "shepherd I shall not"),
+    ("the lord is my shepherd", "herd I shall not"),
+])
+def test_word_misheard_at_the_boundary_is_not_duplicated(first, second):
+    stitcher = TranscriptStitcher(overlap=0.5)
+    out = stitch(stitcher, [(first, 1.5), (second, 1.5)])
+    assert out[:4] == ["the", "lord", "is", "my"]
+    assert out[5:] == ["I", "shall", "not"]
+    assert len(out) == 8
@@ -0,0 +1,46 @@
+import dataclasses
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("whisper")
+
+from whisper.model import ModelDimensions, Whisper  # noqa: E402
+
+from src.stt.engines.whisper_stt import load_whisper_mmap  # noqa: E402
+
+DIMS = ModelDimensions(
+    n_mels=80, n_audio_ctx=8, n_audio_state=16, n_audio_head=2, n_audio_layer=1,
+    n_vocab=64, n_text_ctx=8, n_text_state=16, n_text_head=2, n_text_layer=1)
+
+
+@pytest.fixture
+def fp16_checkpoint(tmp_path):
+    """A tiny checkpoint stored in fp16, like the official ones."""
+    path = tmp_path / "tiny-test.pt"
+    model = Whisper(DIMS).half()
+    torch.save({"dims": dataclasses.asdict(DIMS),
+                "model_state_dict": model.state_dict()}, path)
+    return path
+
+
+def test_fp16_checkpoint_loads_as_float32(fp16_checkpoint, tmp_path):
+    model = load_whisper_mmap(str(fp16_checkpoint), download_root=str(tmp_path / "cache"))
+
+    assert {p.dtype for p in model.parameters()} == {torch.float32}
+    # Runs the encoder's LayerNorms on float32 input, as transcribe(fp16=False) does
+    mel = torch.zeros(1, DIMS.n_mels, 2 * DIMS.n_audio_ctx)
+    with torch.no_grad():
+        features = model.embed_audio(mel)
+    assert features.shape == (1, DIMS.n_audio_ctx, DIMS.n_audio_state)
+
+
+def test_converted_checkpoint_is_reused(fp16_checkpoint, tmp_path):
+    cache = tmp_path / "cache"
+    load_whisper_mmap(str(fp16_checkpoint), download_root=str(cache))
+    converted = list(cache.glob("*.fp32.pt"))
+    assert len(converted) == 1
+
+    mtime = converted[0].stat().st_mtime_ns
+    load_whisper_mmap(str(fp16_checkpoint), download_root=str(cache))
+    assert converted[0].stat().st_mtime_ns == mtime